@@ -11,7 +11,8 @@ load_dotenv()
 key = os.getenv('GEMINI_API_KEY')
 
 import pyautogui
-import time
+
+from scroll import scroll_engine
 
 # Platform checks
 IS_WINDOWS = platform.system() == 'Windows'
@@ -120,9 +121,8 @@ def handle_chrome_command(text):
     scroll_parsed = parse_scroll_command(text)
     if scroll_parsed:
         scroll_amt, times = scroll_parsed
-        for _ in range(times):
-            pyautogui.scroll(scroll_amt)
-            time.sleep(0.1)
+        # one smooth coast instead of `times` jumps 0.1 s apart
+        scroll_engine().fling(scroll_amt * times)
         return True
     return False
 
@@ -217,9 +217,8 @@ class geminiAgent():
             scroll_amt = SCROLL_INTENSITY['']
             times = 1
         scroll_amt = scroll_amt * SCROLL_SYNONYMS[direction]
-        for _ in range(times):
-            pyautogui.scroll(scroll_amt)
-            time.sleep(0.1)
+        # one smooth coast instead of `times` jumps 0.1 s apart
+        scroll_engine().fling(scroll_amt * times)
     
     def close_app(self, app_name: str):
         system = platform.system()
@@ -0,0 +1,111 @@
+# bench.py
+"""Replay a recorded session through the tracking pipeline without a webcam or GUI.
+
+    python bench.py session.mp4 --mode hand --out cursor.csv
+    python bench.py frames_dir/ --mode eye --realtime
+    python bench.py session.mp4 --mode hand --profile lite
+    python bench.py session.mp4 --mode hand --roi        # with the ROI crop
+
+Prints frames per second and inference time, and optionally writes the
+per-frame cursor output to CSV so runs can be diffed between changes.
+"""
+
+import argparse
+import csv
+import time
+
+import cv2
+
+from inference_profiles import PROFILES
+from landmark_log import LandmarkRecorder
+from session import make_worker
+from sources import ReplaySource
+
+
+def cursor_from_result(mode, res, screen_w, screen_h):
+    """The cursor target the GUI tracker would produce for this result, or None."""
+    if mode == "eye":
+        # raw iris position; gaze mapping needs a calibration to go further
+        if res.landmarks is None:
+            return None
+        return float(res.landmarks[468, 0]), float(res.landmarks[468, 1])
+    for lm, label in zip(res.hands, res.labels):
+        if label == "Left":
+            # same mapping as HandTrackerWidget
+            return int(lm[8, 0] * screen_w), int(lm[8, 1] * screen_h)
+    return None
+
+
+def run(path, mode="eye", realtime=False, use_roi=False, out=None, record=None, screen=(1920, 1080),
+        profile=None):
+    kind = "face" if mode == "eye" else "hands"
+    profile = PROFILES[profile] if profile else None
+    worker = make_worker(kind, profile, use_roi)
+    model = worker.model_factory()
+    src = ReplaySource(path, realtime=realtime)
+
+    recorder = LandmarkRecorder(record, kind) if record else None
+    writer = None
+    if out:
+        fh = open(out, "w", newline="")
+        writer = csv.writer(fh)
+        writer.writerow(["ts", "detected", "x", "y", "infer_ms"])
+
+    frames, detected, infer_total = 0, 0, 0.0
+    t0 = time.perf_counter()
+    try:
+        while True:
+            ret, frame = src.read()
+            if not ret:
+                break
+            frame = cv2.flip(frame, 1)  # the live pipeline is mirrored too
+            if profile and frame.shape[1] > profile.resolution[0]:
+                # what the camera would deliver at the profile's resolution
+                frame = cv2.resize(frame, profile.resolution, interpolation=cv2.INTER_AREA)
+            res = worker.process(model, frame, src.timestamp)
+            if recorder:
+                recorder.write(res)
+            cur = cursor_from_result(mode, res, *screen)
+            frames += 1
+            infer_total += res.infer_ms
+            if cur is not None:
+                detected += 1
+            if writer:
+                x, y = cur if cur is not None else ("", "")
+                writer.writerow([f"{src.timestamp:.4f}", int(cur is not None), x, y, f"{res.infer_ms:.2f}"])
+    finally:
+        elapsed = time.perf_counter() - t0
+        model.close()
+        src.release()
+        if recorder:
+            recorder.close()
+        if writer:
+            fh.close()
+
+    stats = {
+        "frames": frames,
+        "detected": detected,
+        "fps": frames / elapsed if elapsed else 0.0,
+        "infer_ms": infer_total / frames if frames else 0.0,
+    }
+    if worker.roi:
+        stats["roi_frames"] = worker.roi.roi_frames
+        stats["full_frames"] = worker.roi.full_frames
+    return stats
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("source", help="video file or directory of images")
+    ap.add_argument("--mode", choices=("eye", "hand"), default="eye")
+    ap.add_argument("--realtime", action="store_true", help="replay at the original frame timing")
+    ap.add_argument("--roi", action="store_true", help="crop around the last face/hand box (see roi.py)")
+    ap.add_argument("--out", help="write per-frame cursor output to this CSV")
+    ap.add_argument("--record", help="write per-frame landmarks to this landmark log (.lmk)")
+    ap.add_argument("--profile", choices=list(PROFILES), help="inference profile (default: MediaPipe defaults)")
+    args = ap.parse_args()
+
+    stats = run(args.source, args.mode, args.realtime, args.roi, args.out, args.record,
+                profile=args.profile)
+    for k, v in stats.items():
+        print(f"{k:>12}: {v:.2f}" if isinstance(v, float) else f"{k:>12}: {v}")
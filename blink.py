@@ -0,0 +1,110 @@
+# blink.py
+"""Per-user blink detection from the eye aspect ratio (EAR).
+
+A fixed EAR threshold works for some faces and not others: open-eye EAR
+ranges from ~0.2 to ~0.35 between people, cameras and head poses. Instead
+the detector keeps a running estimate of this user's open-eye EAR (an
+exponential moving mean and variance, O(1) per frame) and places two
+thresholds below it:
+
+    close = mean - max(close_k·std, min_drop·mean)    eye counts as closing
+    open  = mean - max(open_k·std, min_drop·mean / 2) eye counts as open again
+
+The gap between them is the hysteresis, so EAR noise around one line can't
+produce a burst of blinks. A closure only becomes a blink if it lasts
+between `min_duration` and `max_duration` seconds: shorter is landmark
+jitter, longer is the user looking down or resting their eyes.
+"""
+
+from collections import namedtuple
+
+# t: time the eye reopened; confidence in [0, 1]: 0.5 = EAR only just
+# crossed the close threshold, 1 = it dropped twice as far
+BlinkEvent = namedtuple("BlinkEvent", "t duration min_ear confidence")
+
+
+class AdaptiveBlinkDetector:
+    """Streaming blink detector; feed update(ear, t) once per frame."""
+
+    def __init__(self, alpha=0.02, close_k=4.0, open_k=2.0, min_drop=0.2,
+                 min_duration=0.05, max_duration=0.5, warmup=30,
+                 resync_after=3.0, initial_ear=0.3):
+        self.alpha = alpha
+        self.close_k = close_k
+        self.open_k = open_k
+        self.min_drop = min_drop
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+        self.warmup = warmup
+        self.resync_after = resync_after
+        self.initial_ear = initial_ear
+        self.reset()
+
+    def reset(self):
+        self.mean = self.initial_ear
+        self.var = 0.0
+        self.n = 0            # open-eye samples seen
+        self.closed = False
+        self._closed_at = 0.0
+        self._min_ear = 0.0
+
+    # ─ Thresholds ───────────────────────────────────────
+    @property
+    def std(self):
+        return self.var ** 0.5
+
+    @property
+    def close_thresh(self):
+        return self.mean - max(self.close_k * self.std, self.min_drop * self.mean)
+
+    @property
+    def open_thresh(self):
+        return self.mean - max(self.open_k * self.std, 0.5 * self.min_drop * self.mean)
+
+    @property
+    def ready(self):
+        return self.n >= self.warmup
+
+    def to_dict(self):
+        return {"mean": self.mean, "var": self.var}
+
+    def restore(self, d):
+        """Warm start from a saved open-eye estimate: ready from the first frame."""
+        self.reset()
+        self.mean, self.var = d["mean"], d["var"]
+        self.n = self.warmup
+
+    def _learn(self, ear):
+        # plain average while warming up, then a fixed-rate EMA
+        self.n += 1
+        a = max(self.alpha, 1.0 / self.n)
+        d = ear - self.mean
+        self.mean += a * d
+        self.var = (1 - a) * (self.var + a * d * d)
+
+    # ─ Per frame ────────────────────────────────────────
+    def update(self, ear, t):
+        """Returns a BlinkEvent on the frame the eye reopens after a blink, else None."""
+        if not self.closed:
+            if ear < self.close_thresh and self.ready:
+                self.closed, self._closed_at, self._min_ear = True, t, ear
+                return None
+            if ear >= self.open_thresh or not self.ready:
+                self._learn(ear)
+            return None
+
+        self._min_ear = min(self._min_ear, ear)
+        duration = t - self._closed_at
+        if ear < self.open_thresh:
+            if duration > self.resync_after:
+                # "closed" for seconds: the open-eye estimate is stale
+                # (new user, lighting, head pose) → learn it again
+                self.reset()
+            return None
+
+        self.closed = False
+        if not self.min_duration <= duration <= self.max_duration:
+            return None
+        depth = (self.mean - self._min_ear) / max(self.mean - self.close_thresh, 1e-6)
+        confidence = min(1.0, max(0.0, depth / 2.0))
+        return BlinkEvent(t, duration, self._min_ear, confidence)
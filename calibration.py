@@ -0,0 +1,151 @@
+# calibration.py
+"""Regression-based mapping from a 2-D tracking feature to the screen.
+
+Calibration collects one feature sample (iris or fingertip position) per grid
+target, fits the model once, and stores it as a small coefficient matrix, so
+mapping a frame is one feature expansion and one matrix multiply:
+
+    poly2      [1, x, y, xy, x², y²] @ C   (C is 6×2, needs ≥ 6 points)
+    affine     [1, x, y] @ C               (C is 3×2, fallback for < 6 points)
+    homography H @ [x, y, 1]               (H is 3×3, needs ≥ 4 points)
+
+Screen positions are normalized to [0, 1] so the same model works for any
+resolution, and a saved model can be re-used across sessions: recenter()
+checks it against one known target and absorbs small drift into a bias.
+"""
+
+import cv2
+import numpy as np
+
+GRID_SIZES = (9, 16)
+DRIFT_TARGET = (0.5, 0.5)
+DRIFT_TOLERANCE = 0.08  # normalized screen units; beyond this, recalibrate
+_ROWS = {3: ("TOP", "MIDDLE", "BOTTOM")}
+_COLS = {3: ("LEFT", "CENTER", "RIGHT")}
+
+
+def grid_targets(n=9, margin=0.05):
+    """n = 9 or 16 → list of normalized (u, v) targets, row by row from the top-left."""
+    k = int(round(n ** 0.5))
+    if k * k != n:
+        raise ValueError(f"calibration grid must be square, got {n} points")
+    ticks = np.linspace(margin, 1 - margin, k)
+    return [(float(u), float(v)) for v in ticks for u in ticks]
+
+
+def grid_labels(n=9):
+    """Human-readable name for each target of grid_targets(n)."""
+    k = int(round(n ** 0.5))
+    if k in _ROWS:
+        return [
+            "CENTER" if (r, c) == (1, 1) else f"{_ROWS[k][r]}‑{_COLS[k][c]}"
+            for r in range(k) for c in range(k)
+        ]
+    return [f"the dot ({i + 1}/{n})" for i in range(n)]
+
+
+def _poly2(x, y):
+    return np.array([1.0, x, y, x * y, x * x, y * y])
+
+
+class CalibrationModel:
+    """Fitted feature → normalized screen mapping."""
+
+    def __init__(self, kind="poly2"):
+        self.kind = kind
+        self.coef = None
+        self.offset = np.zeros(2)
+        self.scale = np.ones(2)
+        self.bias = np.zeros(2)  # drift correction from recenter()
+        self.rms_error = None  # fit residual, in normalized screen units
+
+    @property
+    def fitted(self):
+        return self.coef is not None
+
+    def fit(self, features, targets, ridge=1e-4):
+        f = np.asarray(features, dtype=np.float64)
+        t = np.asarray(targets, dtype=np.float64)
+        if len(f) != len(t) or len(f) < 3:
+            raise ValueError("need at least 3 matching feature/target pairs")
+
+        # iris positions only span a few hundredths; normalize for a stable fit
+        self.offset = f.mean(0)
+        self.scale = np.where(f.std(0) > 1e-9, f.std(0), 1.0)
+        fn = (f - self.offset) / self.scale
+
+        kind = self.kind
+        if kind == "poly2" and len(f) < 6:
+            kind = "affine"
+        if kind == "homography" and len(f) < 4:
+            kind = "affine"
+        self.kind = kind
+
+        if kind == "homography":
+            H, _ = cv2.findHomography(fn.astype(np.float32), t.astype(np.float32), 0)
+            self.coef = H
+        else:
+            X = np.array([_poly2(x, y) for x, y in fn])
+            if kind == "affine":
+                X = X[:, :3]
+            # ridge-regularized least squares: (XᵀX + λI)⁻¹ Xᵀ t
+            A = X.T @ X + ridge * np.eye(X.shape[1])
+            self.coef = np.linalg.solve(A, X.T @ t)
+
+        self.bias = np.zeros(2)
+        pred = np.array([self.map(x, y, clip=False) for x, y in f])
+        self.rms_error = float(np.sqrt(((pred - t) ** 2).sum(1).mean()))
+        return self
+
+    def map(self, x, y, clip=True):
+        """Feature (x, y) → normalized screen (u, v)."""
+        x = (x - self.offset[0]) / self.scale[0]
+        y = (y - self.offset[1]) / self.scale[1]
+        if self.kind == "homography":
+            p = self.coef @ np.array([x, y, 1.0])
+            u, v = p[0] / p[2], p[1] / p[2]
+        else:
+            phi = _poly2(x, y)[:len(self.coef)]
+            u, v = phi @ self.coef
+        u, v = u + self.bias[0], v + self.bias[1]
+        if clip:
+            u, v = min(1.0, max(0.0, u)), min(1.0, max(0.0, v))
+        return float(u), float(v)
+
+    def to_screen(self, x, y, width, height, left=0, top=0):
+        u, v = self.map(x, y)
+        return int(left + u * (width - 1)), int(top + v * (height - 1))
+
+    def recenter(self, feature, target=DRIFT_TARGET, tol=DRIFT_TOLERANCE):
+        """1-point drift check against a known target → (ok, error).
+
+        Within `tol` the offset is folded into `bias` so the saved fit keeps
+        working; beyond it the model is stale and needs a full calibration.
+        """
+        u, v = self.map(*feature, clip=False)
+        err = float(np.hypot(target[0] - u, target[1] - v))
+        if err > tol:
+            return False, err
+        self.bias += (target[0] - u, target[1] - v)
+        return True, err
+
+    # ─ Persistence ───────────────────────────────────────
+    def to_dict(self):
+        return {
+            "kind": self.kind,
+            "coef": self.coef.tolist(),
+            "offset": self.offset.tolist(),
+            "scale": self.scale.tolist(),
+            "bias": self.bias.tolist(),
+            "rms_error": self.rms_error,
+        }
+
+    @classmethod
+    def from_dict(cls, d):
+        m = cls(d["kind"])
+        m.coef = np.array(d["coef"])
+        m.offset = np.array(d["offset"])
+        m.scale = np.array(d["scale"])
+        m.bias = np.array(d.get("bias", (0.0, 0.0)))
+        m.rms_error = d.get("rms_error")
+        return m
@@ -0,0 +1,120 @@
+# camera.py
+
+import threading
+import time
+
+import cv2
+
+from sources import ReplaySource, open_source
+
+
+class CameraStream:
+    """Owns a cv2.VideoCapture on its own thread and only ever hands out the newest frame.
+
+    Older frames that were never consumed are dropped (and counted), so a slow
+    consumer always sees the freshest image instead of a backlog from the driver.
+    """
+
+    def __init__(self, src=0, mirror=False, realtime=True, size=None):
+        self.src = src  # camera index, or a video file / image directory to replay
+        self.mirror = mirror
+        self.size = size  # requested (width, height); None keeps the driver default
+        self.realtime = realtime
+        self.cap = None
+
+        # ─ Latest-frame buffer ───────────────────────────
+        self._cond = threading.Condition()
+        self._frame = None
+        self._frame_ts = 0.0
+        self._seq = 0
+        self._read_seq = 0
+
+        self._thread = None
+        self._running = False
+
+        # ─ Stats ─────────────────────────────────────────
+        self.captured = 0
+        self.dropped = 0
+        self.last_age = 0.0
+        self.last_ts = 0.0       # monotonic capture time of the last frame read
+        self.last_flip_ms = 0.0  # time spent mirroring the last frame read
+        self._flip_ms = 0.0
+
+    def start(self):
+        if self._running:
+            return self
+        self.cap = open_source(self.src, realtime=self.realtime)
+        # keep the driver queue as short as possible so reads are never stale
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if self.size:
+            # smaller frames cut capture, convert and inference cost alike
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.size[0])
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.size[1])
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name="CameraStream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self.cap:
+            self.cap.release()
+            self.cap = None
+
+    def isOpened(self):
+        return self._running and self.cap is not None and self.cap.isOpened()
+
+    def _loop(self):
+        while self._running:
+            ret, frame = self.cap.read()
+            if not ret:
+                if isinstance(self.cap, ReplaySource):
+                    break  # recording finished
+                time.sleep(0.005)
+                continue
+            ts = time.monotonic()
+            flip_ms = 0.0
+            if self.mirror:
+                frame = cv2.flip(frame, 1)
+                flip_ms = (time.monotonic() - ts) * 1000.0
+            with self._cond:
+                if self._seq != self._read_seq:
+                    # previous frame was never consumed → drop it
+                    self.dropped += 1
+                self._frame, self._frame_ts, self._flip_ms = frame, ts, flip_ms
+                self._seq += 1
+                self.captured += 1
+                self._cond.notify_all()
+
+    def read(self, wait=False, timeout=None):
+        """Return (ret, frame) like VideoCapture.read().
+
+        ret is False when no new frame arrived since the last read. By default
+        this never blocks; pass wait=True to block until a fresh frame (or timeout).
+        """
+        with self._cond:
+            if wait:
+                self._cond.wait_for(
+                    lambda: self._seq != self._read_seq or not self._running, timeout
+                )
+            if self._frame is None or self._seq == self._read_seq:
+                return False, None
+            self._read_seq = self._seq
+            self.last_ts = self._frame_ts
+            self.last_flip_ms = self._flip_ms
+            self.last_age = time.monotonic() - self._frame_ts
+            return True, self._frame
+
+    def stats(self):
+        """Captured/dropped frame counts and the capture-to-consume age of the last read."""
+        with self._cond:
+            return {
+                "captured": self.captured,
+                "dropped": self.dropped,
+                "age_ms": self.last_age * 1000.0,
+            }
@@ -0,0 +1,185 @@
+# cursor.py
+
+import math
+import threading
+import time
+
+import pyautogui
+from PyQt5.QtGui import QGuiApplication
+
+from screens import screen_geometry
+
+
+class CursorActuator:
+    """Moves the OS cursor on its own thread so trackers never block on it.
+
+    Trackers call move_to() with wherever the cursor should end up; only the
+    latest target is kept (older ones are coalesced and counted), and the
+    thread eases the cursor toward it once per display refresh, covering
+    ~63% of the remaining distance every `glide` seconds. Clicks and button
+    presses are queued and run in order on the same thread, after the cursor
+    has snapped to the current target.
+
+    pyautogui sleeps pyautogui.PAUSE (0.1 s) after every call and
+    moveTo(duration=…) sleeps for the whole tween; here every call passes
+    _pause=False and the only waiting is the thread's own refresh tick.
+
+    A failing pyautogui call (FailSafeException in a screen corner, an X or
+    Wayland error) is logged and counted; the thread carries on with the
+    next target or action.
+    """
+
+    def __init__(self, hz=60.0, glide=0.05):
+        self.hz = hz
+        self.glide = glide
+
+        # ─ Latest target & queued button actions ─────────
+        self._cond = threading.Condition()
+        self._target = None
+        self._actions = []
+        self._pos = None  # float position the thread last moved to
+
+        self._thread = None
+        self._running = False
+
+        # ─ Stats ─────────────────────────────────────────
+        self.targets = 0
+        self.coalesced = 0
+        self.moves = 0
+        self.errors = 0
+        self._last_error = (None, 0.0)
+
+    def start(self):
+        """Start the thread, or restart it if it died."""
+        if self._running and self._thread and self._thread.is_alive():
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name="CursorActuator", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    # ─ Called from tracker threads ──────────────────────
+    def move_to(self, x, y):
+        """Set the cursor target; returns immediately."""
+        with self._cond:
+            if self._target is not None and self._target != self._pos:
+                self.coalesced += 1  # previous target never reached
+            self._target = (float(x), float(y))
+            self.targets += 1
+            self._cond.notify()
+
+    def click(self, button="left", clicks=1):
+        self._queue(pyautogui.click, button=button, clicks=clicks, interval=0.0)
+
+    def mouse_down(self, button="left"):
+        self._queue(pyautogui.mouseDown, button=button)
+
+    def mouse_up(self, button="left"):
+        self._queue(pyautogui.mouseUp, button=button)
+
+    def key_down(self, key):
+        self._queue(pyautogui.keyDown, key=key)
+
+    def key_up(self, key):
+        self._queue(pyautogui.keyUp, key=key)
+
+    def _queue(self, fn, **kwargs):
+        with self._cond:
+            self._actions.append((fn, kwargs))
+            self._cond.notify()
+
+    def position(self):
+        """Where the cursor is heading (falls back to the real OS position)."""
+        with self._cond:
+            target = self._target
+        if target is None:
+            return tuple(pyautogui.position())
+        return int(target[0]), int(target[1])
+
+    def stats(self):
+        with self._cond:
+            return {"targets": self.targets, "coalesced": self.coalesced, "moves": self.moves,
+                    "errors": self.errors}
+
+    # ─ Actuator thread ──────────────────────────────────
+    def _loop(self):
+        try:
+            self._pos = tuple(map(float, pyautogui.position()))
+        except Exception as e:
+            self._failed("position", e)
+            self._pos = (0.0, 0.0)
+        last = time.monotonic()
+        while self._running:
+            with self._cond:
+                # sleep until there is somewhere to go or something to press
+                self._cond.wait_for(
+                    lambda: self._actions or (self._target not in (None, self._pos))
+                    or not self._running
+                )
+                target, actions, self._actions = self._target, self._actions, []
+            if not self._running:
+                break
+
+            now = time.monotonic()
+            dt, last = min(now - last, 1.0 / self.hz), now
+            if actions:
+                # a click lands where the tracker aimed, not mid‑glide
+                self._step(target, 1.0)
+                for fn, kwargs in actions:
+                    try:
+                        fn(_pause=False, **kwargs)
+                    except Exception as e:
+                        self._failed(fn.__name__, e)
+            elif target is not None:
+                self._step(target, 1.0 - math.exp(-dt / self.glide))
+                time.sleep(max(0.0, 1.0 / self.hz - (time.monotonic() - now)))
+
+    def _step(self, target, k):
+        if target is None:
+            return
+        x = self._pos[0] + (target[0] - self._pos[0]) * k
+        y = self._pos[1] + (target[1] - self._pos[1]) * k
+        if abs(target[0] - x) < 0.5 and abs(target[1] - y) < 0.5:
+            x, y = target
+        if (int(x), int(y)) != (int(self._pos[0]), int(self._pos[1])):
+            try:
+                pyautogui.moveTo(int(x), int(y), _pause=False)
+                self.moves += 1
+            except Exception as e:
+                self._failed("moveTo", e)
+        # even after a failed move, so the thread waits for the next target
+        # instead of retrying this one every tick
+        with self._cond:
+            self._pos = (x, y)
+
+    def _failed(self, what, e):
+        """Count a failed pyautogui call; log it unless it just repeats the last one."""
+        self.errors += 1
+        msg = f"{what}: {type(e).__name__}: {e}"
+        now = time.monotonic()
+        if msg != self._last_error[0] or now - self._last_error[1] > 5.0:
+            print(f"Cursor actuator: {msg}")
+            self._last_error = (msg, now)
+
+
+_instance = None
+
+
+def cursor_actuator():
+    """The shared, running CursorActuator, ticking at the primary display's refresh rate."""
+    global _instance
+    if _instance is None:
+        # standalone OpenCV scripts (handMovement.py) have no Qt application to ask
+        hz = screen_geometry().monitor().refresh if QGuiApplication.instance() else None
+        hz = hz or 60.0
+        _instance = CursorActuator(hz=hz)
+    # also brings back a thread that died
+    return _instance.start()
@@ -0,0 +1,70 @@
+# dwell.py
+
+import math
+
+# dwell action → CursorActuator.click() arguments
+ACTIONS = {
+    "click": {"button": "left", "clicks": 1},
+    "double": {"button": "left", "clicks": 2},
+    "right": {"button": "right", "clicks": 1},
+}
+
+
+class DwellEngine:
+    """Dwell‑to‑click on monotonic timestamps, independent of frame rate.
+
+    A dwell starts where the cursor settles and keeps running while samples
+    stay within `exit_radius` of that anchor; only a sample beyond it starts
+    over. The anchor follows the mean of the samples inside the smaller
+    `radius`, so slow drift doesn't end a dwell but a real move does. Once
+    `dwell` seconds have passed the action fires once; the cursor has to
+    leave the exit radius before it can fire again.
+
+    update() feeds a cursor sample; tick() only advances the clock, so a
+    timer can fire the click and animate progress between camera frames.
+    Samples older than `max_gap` (tracking lost) cancel the dwell.
+    """
+
+    def __init__(self, dwell=1.0, radius=30.0, exit_radius=None, action="click", max_gap=0.3):
+        self.dwell = dwell
+        self.radius = radius
+        self.exit_radius = exit_radius  # None → 1.5 × radius
+        self.action = action
+        self.max_gap = max_gap
+        self.reset()
+
+    def reset(self):
+        self.anchor = None
+        self._n = 0
+        self._start = 0.0
+        self._last = 0.0
+        self._armed = True
+        self.progress = 0.0
+
+    def update(self, x, y, t):
+        """Feed a cursor position; returns the fired action name or None."""
+        exit_r = self.exit_radius or 1.5 * self.radius
+        if self.anchor is None or t - self._last > self.max_gap:
+            self.anchor, self._n, self._start, self._armed = (x, y), 1, t, True
+        else:
+            d = math.hypot(x - self.anchor[0], y - self.anchor[1])
+            if d > exit_r:
+                self.anchor, self._n, self._start, self._armed = (x, y), 1, t, True
+            elif d <= self.radius:
+                self._n += 1
+                ax, ay = self.anchor
+                self.anchor = (ax + (x - ax) / self._n, ay + (y - ay) / self._n)
+        self._last = t
+        return self.tick(t)
+
+    def tick(self, t):
+        """Advance to time t; returns the fired action name or None."""
+        if self.anchor is None or not self._armed or t - self._last > self.max_gap:
+            self.progress = 0.0
+            return None
+        self.progress = min(1.0, (t - self._start) / self.dwell)
+        if self.progress < 1.0:
+            return None
+        self._armed = False
+        self.progress = 0.0
+        return self.action
@@ -1,43 +1,61 @@
 # eye_widget.py
 
 import time
-import cv2
-import mediapipe as mp
+from collections import deque
 import numpy as np
-import pyautogui
 
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QPushButton,
     QVBoxLayout, QDialog, QFormLayout,
-    QDoubleSpinBox, QSpinBox
+    QDoubleSpinBox, QSpinBox, QComboBox, QCheckBox
 )
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QImage, QPixmap
+
+import profiles
+from blink import AdaptiveBlinkDetector
+from calibration import DRIFT_TARGET, GRID_SIZES, CalibrationModel, grid_labels, grid_targets
+from cursor import cursor_actuator
+from dwell import ACTIONS, DwellEngine
+from filters import OneEuroFilter, Predictor, add_filter_rows, filter_from_dict, filter_to_dict
+from headpose import HeadPose
+from landmarks import LEFT_IRIS, mean_ear
+from latency import LatencyStats
+from overlays import DwellRing, TargetOverlay
+from preview import PreviewRenderer
+from scheduler import FrameScheduler
+from screens import screen_geometry
+from session import VisionSession
 
 class EyeTrackerWidget(QWidget):
     calibration_complete = pyqtSignal()
+    # (headless, CPU ms per frame saved by skipping the preview)
+    headless_changed = pyqtSignal(bool, float)
 
-    def __init__(self):
+    def __init__(self, session=None):
         super().__init__()
         self.setFocusPolicy(Qt.StrongFocus)
 
+        # ─ Camera & model session (shared when given) ────
+        self._owns_session = session is None
+        self.session = session or VisionSession(kinds=("face",))
+
         # ─ Calibration state ─────────────────────────────
         self.calibrated = False
         self.calibration_points = []
         self.calibration_step = 0
-        self.instructions = [
-            "Look at TOP‑LEFT and double‑blink",
-            "Look at TOP‑RIGHT and double‑blink",
-            "Look at BOTTOM‑RIGHT and double‑blink",
-            "Look at BOTTOM‑LEFT and double‑blink",
-            "Look at CENTER and double‑blink",
-        ]
+        self.calib = CalibrationModel()
+        self.calibrated_at = 0.0  # monotonic time the current calibration was confirmed
+        self.recent_iris = deque(maxlen=10)  # open‑eye samples before the blink
+        self.head = HeadPose()
+        self.head_pose_on = True  # calibrate on head‑normalized gaze, not raw iris
+        self.screens = screen_geometry()
+        self.monitor_index = 0  # gaze target monitor, 0 = primary
+        self.target_overlay = TargetOverlay()
+        self._set_grid(9)
 
         # ─ Blink detection ───────────────────────────────
-        self.LEFT_EYE  = [33,160,158,133,153,144]
-        self.RIGHT_EYE = [362,385,387,263,373,380]
-        self.blink_thresh = 0.21
-        self.is_blinking = False
+        self.blink = AdaptiveBlinkDetector()
+        self.blink_conf = 0.0  # minimum BlinkEvent.confidence that counts
         self.blink_times = []
         self.double_window = 0.5
         self.last_blink = 0
@@ -45,15 +63,25 @@ class EyeTrackerWidget(QWidget):
 
         # ─ Gaze smoothing & dwell ────────────────────────
         self.smoothed = None
+        self.filter   = OneEuroFilter(min_cutoff=0.5, beta=0.005)
+        self.predictor = Predictor()
+        self.predict  = False
         self.move_thr = 20
-        self.alpha    = 0.3
-        self.dwell    = 1.0
-        self.dwell_ts = 0
-        self.last_click = 0
+        self.cursor   = cursor_actuator()
+        self.dwell    = DwellEngine(dwell=1.0, radius=30)
+        self.dwell_ring = DwellRing()
+        self.gaze_clicks = True  # blink/dwell clicks; off when a hand does the clicking
+        # animates the ring (and fires the click) between camera frames
+        self.dwell_timer = QTimer(self)
+        self.dwell_timer.setInterval(30)
+        self.dwell_timer.timeout.connect(lambda: self._on_dwell(self.dwell.tick(time.monotonic())))
 
         # ─ UI setup ───────────────────────────────────────
         self.instruction_label = QLabel(self.instructions[0], alignment=Qt.AlignCenter)
         self.video_label       = QLabel(alignment=Qt.AlignCenter)
+        self.preview           = PreviewRenderer(self.video_label)
+        self.headless          = False
+        self.latency           = LatencyStats()
         self.recalib_btn       = QPushButton("Re‑calibrate")
         self.recalib_btn.clicked.connect(self.start_recalib)
         self.settings_btn      = QPushButton("Settings")
@@ -68,63 +96,91 @@ class EyeTrackerWidget(QWidget):
         # ─ Frame update timer ─────────────────────────────
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._update)
+        self.scheduler = FrameScheduler(self.timer)
 
         # ─ after calibration, shrink the preview ─────────
         self.calibration_complete.connect(self._on_calibrated)
 
+        # ─ Saved profile: 1‑point drift check instead of a full calibration
+        self.load_profile(profiles.default_name())
+
+    def _set_grid(self, n):
+        self.grid_size = n
+        self.targets = grid_targets(n)
+        self.instructions = [f"Look at {name} and double‑blink" for name in grid_labels(n)]
+
+    def _show_target(self):
+        u, v = DRIFT_TARGET if self.drift_check else self.targets[self.calibration_step]
+        self.target_overlay.show_target(*self.screens.to_screen(u, v, self.monitor_index))
+
     def start_tracking(self):
-        self.cap = cv2.VideoCapture(0)
-        self.face_mesh = mp.solutions.face_mesh.FaceMesh(refine_landmarks=True)
-        self.timer.start(30)
+        if not self.calibrated:
+            self._show_target()
+        self.worker = self.session.subscribe("face", self._on_result)
+        self.cap = self.session.camera
+        self.scheduler.start()
 
     def stop_tracking(self):
-        self.timer.stop()
-        if hasattr(self, 'cap') and self.cap:
-            self.cap.release()
-            self.cap = None
+        self.scheduler.stop()
+        self.dwell_timer.stop()
+        self.target_overlay.hide()
+        self.dwell_ring.hide()
+        self.session.unsubscribe("face", self._on_result)
+        if self._owns_session:
+            self.session.close()
+
+    def _gaze_feature(self, lm, frame):
+        """What calibration maps: the head‑normalized gaze point, or the raw iris.
 
-    def _get_iris(self, lm):
-        p = lm[468]
-        return p.x, p.y
+        None when the head pose can't be solved this frame; the two kinds are
+        never mixed, since a calibration only holds for the one it was fit on.
+        """
+        if not self.head_pose_on:
+            return float(lm[LEFT_IRIS, 0]), float(lm[LEFT_IRIS, 1])
+        h, w = frame.shape[:2]
+        return self.head.gaze_feature(lm, w, h)
 
     def _map(self, ix, iy):
-        pts = self.calibration_points[:4]
-        minx, maxx = min(p[0] for p in pts), max(p[0] for p in pts)
-        miny, maxy = min(p[1] for p in pts), max(p[1] for p in pts)
-        ix = max(minx, min(maxx, ix))
-        iy = max(miny, min(maxy, iy))
-        # invert horizontal so head-left → cursor-left
-        rx = (ix - minx) / (maxx - minx) if maxx != minx else 0.5
-        ry =     (iy - miny) / (maxy - miny) if maxy != miny else 0.5
-        sw, sh = pyautogui.size()
-        return int(rx * (sw - 1)), int(ry * (sh - 1))
-
-    def _ear(self, lm, ids):
-        pts = [lm[i] for i in ids]
-        A = np.linalg.norm([pts[1].x-pts[5].x, pts[1].y-pts[5].y])
-        B = np.linalg.norm([pts[2].x-pts[4].x, pts[2].y-pts[4].y])
-        C = np.linalg.norm([pts[0].x-pts[3].x, pts[0].y-pts[3].y])
-        return (A+B)/(2*C) if C else 0
+        # fitted once at calibration; per frame this is a single matrix multiply
+        u, v = self.calib.map(ix, iy)
+        return self.screens.to_screen(u, v, self.monitor_index)
 
     def _update(self):
+        # hand the newest frame to the inference thread; results arrive in _on_result
         ret, frame = self.cap.read()
         if not ret:
+            self.scheduler.retry()
             return
+        self.latency.add("capture", self.cap.last_age * 1000.0)
+        self.latency.add("flip", self.cap.last_flip_ms)
+        self.worker.submit(frame, self.cap.last_ts)
+        self.scheduler.submitted()
+
+    def _on_result(self, res):
+        self.latency.add("convert", res.prep_ms)
+        self.latency.add("process", res.infer_ms - res.prep_ms)
+        t0 = time.perf_counter()
+        self.latency.begin()
+        self._process(res)
+        busy_ms = res.infer_ms + (time.perf_counter() - t0) * 1000.0
+        # capture → everything for this frame done (cursor moved, preview drawn)
+        self.latency.add("total", (time.monotonic() - res.ts) * 1000.0)
+        self.scheduler.frame_done(res.landmarks is not None, busy_ms)
 
-        frame = cv2.flip(frame, 1)  # mirror so it feels natural
-        rgb   = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        res   = self.face_mesh.process(rgb)
+    def _process(self, res):
+        frame = res.frame
         now   = time.time()
 
-        if res.multi_face_landmarks:
-            lm  = res.multi_face_landmarks[0].landmark
-            ear = (self._ear(lm,self.LEFT_EYE) + self._ear(lm,self.RIGHT_EYE)) / 2
+        if res.landmarks is not None:
+            lm  = res.landmarks
+            blink = self.blink.update(mean_ear(lm), res.ts)
+            feat = self._gaze_feature(lm, frame)
+            self.latency.lap("features")
+            if not self.blink.closed and feat is not None:
+                self.recent_iris.append(feat)
 
-            # detect blink edge
-            if ear < self.blink_thresh and not self.is_blinking:
-                self.is_blinking = True
-            elif ear >= self.blink_thresh and self.is_blinking:
-                self.is_blinking = False
+            # blink = the frame the eye reopens after a valid closure
+            if blink and blink.confidence >= self.blink_conf:
                 self.last_blink = now
 
                 if not self.calibrated:
@@ -132,77 +188,255 @@ class EyeTrackerWidget(QWidget):
                     self.blink_times.append(now)
                     if len(self.blink_times) > 2:
                         self.blink_times.pop(0)
-                    if (len(self.blink_times)==2 and
+                    if (len(self.blink_times)==2 and self.recent_iris and
                         self.blink_times[1]-self.blink_times[0]<self.double_window):
                         self.blink_times.clear()
-                        ix, iy = self._get_iris(lm)
-                        self.calibration_points.append((ix, iy))
+                        # median of the steady gaze before the blink, not the blink itself
+                        ix, iy = np.median(np.array(self.recent_iris), axis=0)
+                        self.recent_iris.clear()
+                        if self.drift_check:
+                            self._check_drift(float(ix), float(iy))
+                            return
+                        self.calibration_points.append((float(ix), float(iy)))
                         self.calibration_step += 1
                         if self.calibration_step < len(self.instructions):
                             self.instruction_label.setText(self.instructions[self.calibration_step])
+                            self._show_target()
                         else:
-                            self.calibrated = True
-                            self.instruction_label.setText("Calibration complete!")
-                            self.calibration_complete.emit()
-                else:
+                            self.calib = CalibrationModel().fit(self.calibration_points, self.targets)
+                            self._finish_calibration(f"Calibration complete! ({self.calib.kind} fit,"
+                                                     f" rms error {self.calib.rms_error:.3f})")
+                elif self.gaze_clicks:
                     # after calibration, single blink → click
-                    pyautogui.click()
+                    self.cursor.click()
 
             # gaze → cursor & dwell, skip immediately after blink
-            if self.calibrated and (now - self.last_blink) > self.ignore_after_blink:
-                ix, iy = self._get_iris(lm)
-                tx, ty = self._map(ix, iy)
-                if self.smoothed is None:
-                    self.smoothed, self.dwell_ts = (tx, ty), now
-                else:
-                    dx, dy = tx - self.smoothed[0], ty - self.smoothed[1]
-                    dist = (dx*dx + dy*dy)**0.5
-                    if dist < self.move_thr:
-                        if now - self.dwell_ts > self.dwell and now - self.last_click > self.dwell:
-                            pyautogui.click()
-                            self.last_click = now
-                    else:
-                        self.dwell_ts = now
-                        α = min(0.85, max(self.alpha, dist/300))
-                        sx = int(α*tx + (1-α)*self.smoothed[0])
-                        sy = int(α*ty + (1-α)*self.smoothed[1])
-                        self.smoothed = (sx, sy)
-                        pyautogui.moveTo(sx, sy, duration=0.08)
+            if (self.calibrated and feat is not None and not self.blink.closed
+                    and (now - self.last_blink) > self.ignore_after_blink):
+                tx, ty = self._map(*feat)
+                self.latency.lap("ear_map")
+                fx, fy = self.filter.filter(tx, ty, res.ts)
+                self.latency.lap("smoothing")
+                if self.predict:
+                    # lead by this frame's age plus the actuator's glide
+                    horizon = time.monotonic() - res.ts + self.cursor.glide
+                    fx, fy = self.predictor.predict(fx, fy, res.ts, horizon)
+                    self.latency.lap("predict")
+                sx, sy = int(fx), int(fy)
+                if self.smoothed is not None:
+                    dx, dy = sx - self.smoothed[0], sy - self.smoothed[1]
+                if self.smoothed is None or (dx*dx + dy*dy)**0.5 >= self.move_thr:
+                    self.smoothed = (sx, sy)
+                    # never blocks: the actuator thread glides the cursor there
+                    self.cursor.move_to(sx, sy)
+                if self.gaze_clicks:
+                    self._on_dwell(self.dwell.update(fx, fy, res.ts))
+                self.latency.lap("actuation")
+
+        # headless whenever nobody can see the preview: skip rendering
+        headless = not self.preview.visible()
+        if headless != self.headless:
+            self.headless = headless
+            self.headless_changed.emit(headless, self.preview.cost_ms)
+        if headless:
+            return
 
         # show preview
-        h, w, _ = frame.shape
-        img = QImage(frame.data, w, h, 3*w, QImage.Format_RGB888).rgbSwapped()
-        self.video_label.setPixmap(QPixmap.fromImage(img))
+        t0 = time.thread_time()
+        self.latency.begin()
+        self.preview.render(frame)
+        self.latency.lap("preview")
+        self.preview.add_cost(time.thread_time() - t0)
+
+    def _on_dwell(self, action):
+        if action:
+            self.cursor.click(**ACTIONS[action])
+        # ring only once a dwell is clearly underway, so glances don't flash it
+        p = self.dwell.progress
+        self.dwell_ring.set_progress(self.dwell.anchor, p if p >= 0.2 else 0.0)
+        if p > 0.0 and not self.dwell_timer.isActive():
+            self.dwell_timer.start()
+        elif p == 0.0:
+            self.dwell_timer.stop()
+
+    def _check_drift(self, ix, iy):
+        ok, err = self.calib.recenter((ix, iy))
+        if ok:
+            self.drift_check = False
+            self._finish_calibration(f"Welcome back, {self.profile_name}! (drift {err:.3f})")
+        else:
+            self.start_recalib()
+            self.instruction_label.setText(f"Calibration drifted ({err:.3f}) – " + self.instructions[0])
+
+    def _finish_calibration(self, message):
+        self.calibrated = True
+        self.calibrated_at = time.monotonic()
+        self.target_overlay.hide()
+        self.instruction_label.setText(message)
+        self.save_profile()
+        self.calibration_complete.emit()
+
+    # ─ Profiles ─────────────────────────────────────────
+    def profile_state(self):
+        return {
+            "grid": self.grid_size,
+            "head_pose": self.head_pose_on,
+            "monitor": self.monitor_index,
+            "calibration": self.calib.to_dict() if self.calib.fitted else None,
+            "blink": self.blink.to_dict(),
+            "blink_conf": self.blink_conf,
+            "filter": filter_to_dict(self.filter),
+            "predict": self.predict,
+            "move_thr": self.move_thr,
+            "dwell": {"dwell": self.dwell.dwell, "radius": self.dwell.radius,
+                      "action": self.dwell.action},
+        }
+
+    def save_profile(self):
+        state = self.profile_state()
+        if state["calibration"] is None:
+            # mid‑recalibration: don't throw away the last good fit
+            old = profiles.load(self.profile_name).get("eye") or {}
+            state["calibration"] = old.get("calibration")
+        profiles.save(self.profile_name, "eye", state)
+
+    def load_profile(self, name):
+        """Switch to a named profile; with a saved calibration only a drift check is needed."""
+        self.profile_name = name
+        p = profiles.load(name).get("eye") or {}
+        self._set_grid(p.get("grid", self.grid_size))
+        # profiles saved before head‑pose features were calibrated on the raw iris
+        self.head_pose_on = p.get("head_pose", False) if p else self.head_pose_on
+        self.monitor_index = p.get("monitor", self.monitor_index)
+        if "blink" in p:
+            self.blink.restore(p["blink"])
+        self.blink_conf = p.get("blink_conf", self.blink_conf)
+        if "filter" in p:
+            self.filter = filter_from_dict(p["filter"])
+        self.predict = p.get("predict", self.predict)
+        self.move_thr = p.get("move_thr", self.move_thr)
+        for k, v in p.get("dwell", {}).items():
+            setattr(self.dwell, k, v)
+
+        self._reset_calibration()
+        self.instruction_label.setText(self.instructions[0])
+        if p.get("calibration"):
+            self.calib = CalibrationModel.from_dict(p["calibration"])
+            self.drift_check = True
+            self.instruction_label.setText("Look at the dot and double‑blink to confirm your profile")
+        if self.scheduler.running:
+            self._show_target()
+
+    def share_calibration(self, other):
+        """Take over another gaze tab's calibration if it is newer than ours.
+
+        The eye and hybrid tabs track the same user on the same camera, so a
+        calibration (or drift check) done in one holds for the other. The blink
+        detector is shared too, so its thresholds keep adapting in either tab.
+        """
+        if not other.calibrated or other.calibrated_at <= self.calibrated_at:
+            return
+        self.profile_name = other.profile_name
+        self._set_grid(other.grid_size)
+        self.head_pose_on = other.head_pose_on
+        self.monitor_index = other.monitor_index
+        self.blink = other.blink
+        self._reset_calibration()
+        self.calib = other.calib
+        self.calibrated = True
+        self.calibrated_at = other.calibrated_at
+        self.target_overlay.hide()
+        self.instruction_label.setText("Using the current calibration")
+        self.calibration_complete.emit()
 
     def start_recalib(self):
+        self._reset_calibration()
+        self.instruction_label.setText(self.instructions[0])
+        self._show_target()
+
+    def _reset_calibration(self):
+        self.drift_check = False
         self.calibrated = False
         self.calibration_points.clear()
         self.calibration_step = 0
+        self.calib = CalibrationModel()
+        self.recent_iris.clear()
+        self.head.reset()
         self.smoothed = None
-        self.instruction_label.setText(self.instructions[0])
+        self.dwell.reset()
+        self._on_dwell(None)
+        self.filter.reset()
+        self.predictor.reset()
+
+    def _set_head_pose(self, on):
+        # a different feature needs a different fit: recalibrate
+        self.head_pose_on = on
+        self.start_recalib()
+
+    def _set_predict(self, on):
+        self.predict = on
+        self.predictor.reset()
+
+    def _set_monitor(self, index):
+        # a different monitor means a different set of targets: recalibrate
+        self.monitor_index = index
+        self.start_recalib()
+
+    def _set_grid_and_recalib(self, n):
+        self._set_grid(n)
+        self.start_recalib()
 
     def open_settings(self):
         dlg = QDialog(self)
         dlg.setWindowTitle("Settings")
         form = QFormLayout(dlg)
-        dwell = QDoubleSpinBox(); dwell.setRange(0.2,3.0); dwell.setValue(self.dwell)
-        dwell.valueChanged.connect(lambda v: setattr(self,'dwell',v))
+        dwell = QDoubleSpinBox(); dwell.setRange(0.2,3.0); dwell.setValue(self.dwell.dwell)
+        dwell.valueChanged.connect(lambda v: setattr(self.dwell,'dwell',v))
         form.addRow("Dwell (s):", dwell)
+        radius = QSpinBox(); radius.setRange(5,200); radius.setValue(int(self.dwell.radius))
+        radius.valueChanged.connect(lambda v: setattr(self.dwell,'radius',v))
+        form.addRow("Dwell radius (px):", radius)
+        action = QComboBox(); action.addItems(list(ACTIONS)); action.setCurrentText(self.dwell.action)
+        action.currentTextChanged.connect(lambda t: setattr(self.dwell,'action',t))
+        form.addRow("Dwell action:", action)
         thr = QSpinBox(); thr.setRange(1,100); thr.setValue(self.move_thr)
         thr.valueChanged.connect(lambda v: setattr(self,'move_thr',v))
         form.addRow("Move threshold:", thr)
-        αspin = QDoubleSpinBox(); αspin.setRange(0.01,0.99); αspin.setSingleStep(0.01)
-        αspin.setValue(self.alpha); αspin.valueChanged.connect(lambda v: setattr(self,'alpha',v))
-        form.addRow("Smoothing α:", αspin)
+        add_filter_rows(form, self)
+        head = QCheckBox(); head.setChecked(self.head_pose_on)
+        head.toggled.connect(self._set_head_pose)
+        form.addRow("Head‑pose compensation:", head)
+        pred = QCheckBox(); pred.setChecked(self.predict)
+        pred.toggled.connect(self._set_predict)
+        form.addRow("Latency prediction:", pred)
+        conf = QDoubleSpinBox(); conf.setRange(0.0,1.0); conf.setSingleStep(0.05)
+        conf.setValue(self.blink_conf); conf.valueChanged.connect(lambda v: setattr(self,'blink_conf',v))
+        form.addRow("Min blink confidence:", conf)
+        grid = QComboBox(); grid.addItems([str(n) for n in GRID_SIZES])
+        grid.setCurrentText(str(self.grid_size))
+        grid.currentTextChanged.connect(lambda t: self._set_grid_and_recalib(int(t)))
+        form.addRow("Calibration points:", grid)
+        mon = QComboBox()
+        mon.addItems([f"{m.name} ({m.width}×{m.height})" for m in self.screens.monitors])
+        mon.setCurrentIndex(self.monitor_index)
+        mon.currentIndexChanged.connect(self._set_monitor)
+        form.addRow("Target monitor:", mon)
+        prof = QComboBox(); prof.setEditable(True)
+        prof.addItems(sorted(set(profiles.names()) | {self.profile_name}))
+        prof.setCurrentText(self.profile_name)
+        prof.activated[str].connect(lambda name: name != self.profile_name and self.load_profile(name))
+        form.addRow("Profile:", prof)
         btn = QPushButton("Close"); btn.clicked.connect(dlg.close)
         form.addRow(btn)
         dlg.exec_()
+        self.save_profile()
 
     def _on_calibrated(self):
         # shrink the preview widget down into a corner
         self.video_label.setFixedSize(200, 150)
-        self.video_label.setScaledContents(True)
 
     def closeEvent(self, event):
         self.stop_tracking()
+        self.target_overlay.close()
+        self.dwell_ring.close()
         super().closeEvent(event)
\ No newline at end of file
@@ -0,0 +1,226 @@
+# filters.py
+"""Cursor smoothing filters shared by every tracker.
+
+Each filter takes one raw screen position per frame plus its capture time
+(seconds, monotonic) and returns the smoothed position. State is a handful
+of floats in __slots__, so filtering a frame allocates nothing.
+
+    OneEuroFilter   low-pass whose cutoff rises with speed: heavy smoothing
+                    while the cursor is still, little lag while it moves
+    KalmanFilter    constant-velocity Kalman filter per axis
+
+Both start over after a gap longer than `max_gap` (tracking lost), so the
+cursor never glides in from a stale position. An optional Predictor then
+leads the smoothed point by the pipeline latency.
+"""
+
+import math
+
+
+class OneEuroFilter:
+    """One Euro filter (Casiez et al. 2012) on a 2-D point, in screen pixels."""
+
+    NAME = "One Euro"
+    # (attribute, settings label, min, max, step)
+    PARAMS = (
+        ("min_cutoff", "Min cutoff (Hz):", 0.01, 10.0, 0.05),
+        ("beta", "Speed coefficient β:", 0.0, 1.0, 0.001),
+    )
+    __slots__ = ("min_cutoff", "beta", "d_cutoff", "max_gap", "_t", "_x", "_y", "_dx", "_dy")
+
+    def __init__(self, min_cutoff=1.0, beta=0.01, d_cutoff=1.0, max_gap=0.5):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.max_gap = max_gap
+        self.reset()
+
+    def reset(self):
+        self._t = None
+        self._x = self._y = self._dx = self._dy = 0.0
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def filter(self, x, y, t):
+        if self._t is None or t - self._t > self.max_gap:
+            self._t, self._x, self._y, self._dx, self._dy = t, x, y, 0.0, 0.0
+            return x, y
+        dt = t - self._t
+        if dt <= 0:
+            return self._x, self._y
+        self._t = t
+
+        # smoothed speed drives the position cutoff
+        a = self._alpha(self.d_cutoff, dt)
+        self._dx += a * ((x - self._x) / dt - self._dx)
+        self._dy += a * ((y - self._y) / dt - self._dy)
+        cutoff = self.min_cutoff + self.beta * math.hypot(self._dx, self._dy)
+
+        a = self._alpha(cutoff, dt)
+        self._x += a * (x - self._x)
+        self._y += a * (y - self._y)
+        return self._x, self._y
+
+
+class KalmanFilter:
+    """Constant-velocity Kalman filter on a 2-D point, in screen pixels.
+
+    Both axes share the same noise model, so they share one 2×2 covariance
+    (p00, p01, p11) and the update is a few scalar multiplies per axis.
+    """
+
+    NAME = "Kalman"
+    PARAMS = (
+        ("accel", "Process noise (px/s²):", 10.0, 50000.0, 100.0),
+        ("noise", "Measurement noise (px):", 0.5, 200.0, 1.0),
+    )
+    __slots__ = ("accel", "noise", "max_gap", "_t", "_x", "_y", "_vx", "_vy",
+                 "_p00", "_p01", "_p11")
+
+    def __init__(self, accel=3000.0, noise=20.0, max_gap=0.5):
+        self.accel = accel  # std of the unmodelled acceleration
+        self.noise = noise  # std of one raw measurement
+        self.max_gap = max_gap
+        self.reset()
+
+    def reset(self):
+        self._t = None
+        self._x = self._y = self._vx = self._vy = 0.0
+        self._p00 = self._p01 = self._p11 = 0.0
+
+    def filter(self, x, y, t):
+        r = self.noise * self.noise
+        if self._t is None or t - self._t > self.max_gap:
+            self._t, self._x, self._y, self._vx, self._vy = t, x, y, 0.0, 0.0
+            self._p00, self._p01, self._p11 = r, 0.0, 1e6
+            return x, y
+        dt = t - self._t
+        if dt <= 0:
+            return self._x, self._y
+        self._t = t
+
+        # predict: x += v·dt, P = F P Fᵀ + Q (white-noise acceleration)
+        q = self.accel * self.accel
+        dt2 = dt * dt
+        p00 = self._p00 + 2 * dt * self._p01 + dt2 * self._p11 + q * dt2 * dt2 / 4
+        p01 = self._p01 + dt * self._p11 + q * dt2 * dt / 2
+        p11 = self._p11 + q * dt2
+        px = self._x + self._vx * dt
+        py = self._y + self._vy * dt
+
+        # update with the measured position
+        s = p00 + r
+        k0, k1 = p00 / s, p01 / s
+        ex, ey = x - px, y - py
+        self._x, self._y = px + k0 * ex, py + k0 * ey
+        self._vx += k1 * ex
+        self._vy += k1 * ey
+        self._p00, self._p01, self._p11 = (1 - k0) * p00, (1 - k0) * p01, p11 - k1 * p01
+        return self._x, self._y
+
+
+FILTERS = {f.NAME: f for f in (OneEuroFilter, KalmanFilter)}
+
+
+def filter_to_dict(f):
+    """Kind + tunable parameters, for saving in a profile."""
+    return {"kind": f.NAME, **{name: getattr(f, name) for name, *_ in f.PARAMS}}
+
+
+def filter_from_dict(d):
+    cls = FILTERS[d["kind"]]
+    return cls(**{name: d[name] for name, *_ in cls.PARAMS if name in d})
+
+
+class Predictor:
+    """Extrapolates a smoothed position forward to hide pipeline latency.
+
+    Velocity and acceleration are finite differences of successive smoothed
+    positions, each low-passed with `smoothing`, and the point is pushed
+    `horizon` seconds ahead along p + v·h + ½·a·h². The lead is clamped to
+    `max_lead` pixels and dropped entirely below `min_speed` px/s, so a
+    fixating eye or resting finger never drifts and a sudden stop can only
+    overshoot by a bounded amount.
+    """
+
+    __slots__ = ("max_lead", "min_speed", "max_horizon", "smoothing", "max_gap",
+                 "_t", "_x", "_y", "_vx", "_vy", "_ax", "_ay")
+
+    def __init__(self, max_lead=120.0, min_speed=60.0, max_horizon=0.2,
+                 smoothing=0.5, max_gap=0.5):
+        self.max_lead = max_lead
+        self.min_speed = min_speed
+        self.max_horizon = max_horizon
+        self.smoothing = smoothing
+        self.max_gap = max_gap
+        self.reset()
+
+    def reset(self):
+        self._t = None
+        self._x = self._y = self._vx = self._vy = self._ax = self._ay = 0.0
+
+    def predict(self, x, y, t, horizon):
+        if self._t is None or t - self._t > self.max_gap:
+            self.reset()
+            self._t, self._x, self._y = t, x, y
+            return x, y
+        dt = t - self._t
+        if dt <= 0:
+            return x, y
+        k = self.smoothing
+        vx, vy = (x - self._x) / dt, (y - self._y) / dt
+        ax, ay = (vx - self._vx) / dt, (vy - self._vy) / dt
+        self._vx += k * (vx - self._vx)
+        self._vy += k * (vy - self._vy)
+        self._ax += k * (ax - self._ax)
+        self._ay += k * (ay - self._ay)
+        self._t, self._x, self._y = t, x, y
+
+        if math.hypot(self._vx, self._vy) < self.min_speed:
+            return x, y
+        h = min(max(horizon, 0.0), self.max_horizon)
+        lx = self._vx * h + 0.5 * self._ax * h * h
+        ly = self._vy * h + 0.5 * self._ay * h * h
+        # never lead further than max_lead, nor backwards against the motion
+        if lx * self._vx + ly * self._vy < 0:
+            return x, y
+        lead = math.hypot(lx, ly)
+        if lead > self.max_lead:
+            lx, ly = lx * self.max_lead / lead, ly * self.max_lead / lead
+        return x + lx, y + ly
+
+
+def add_filter_rows(form, owner, attr="filter"):
+    """Smoothing picker + the current filter's parameters, for a settings QFormLayout.
+
+    Picking a different filter replaces getattr(owner, attr) with a fresh one.
+    """
+    from PyQt5.QtWidgets import QComboBox, QDoubleSpinBox, QFormLayout, QWidget
+
+    box = QWidget()
+    rows = QFormLayout(box)
+    rows.setContentsMargins(0, 0, 0, 0)
+
+    def show_params():
+        while rows.rowCount():
+            rows.removeRow(0)
+        f = getattr(owner, attr)
+        for name, label, lo, hi, step in f.PARAMS:
+            spin = QDoubleSpinBox(); spin.setDecimals(3)
+            spin.setRange(lo, hi); spin.setSingleStep(step); spin.setValue(getattr(f, name))
+            spin.valueChanged.connect(lambda v, n=name: setattr(getattr(owner, attr), n, v))
+            rows.addRow(label, spin)
+
+    def set_kind(kind):
+        setattr(owner, attr, FILTERS[kind]())
+        show_params()
+
+    kinds = QComboBox(); kinds.addItems(list(FILTERS))
+    kinds.setCurrentText(getattr(owner, attr).NAME)
+    kinds.currentTextChanged.connect(set_kind)
+    form.addRow("Smoothing:", kinds)
+    form.addRow(box)
+    show_params()
@@ -1,12 +1,21 @@
 import sys
+import time
 import cv2
 import mediapipe as mp
 import numpy as np
-import pyautogui
-from PyQt5.QtWidgets import QApplication, QLabel, QWidget, QVBoxLayout, QPushButton, QMainWindow
+from PyQt5.QtWidgets import QApplication, QCheckBox, QLabel, QWidget, QVBoxLayout, QPushButton, QMainWindow
 from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtGui import QImage, QPixmap, QPainter, QColor, QPen
 
+import profiles
+from calibration import CalibrationModel, grid_labels, grid_targets
+from camera import CameraStream
+from cursor import cursor_actuator
+from filters import OneEuroFilter, Predictor, filter_from_dict, filter_to_dict
+from gestures import GestureEngine
+from landmarks import INDEX_TIP, hand_arrays
+from screens import screen_geometry
+
 class FingerOverlay(QMainWindow):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -14,8 +23,8 @@ class FingerOverlay(QMainWindow):
         self.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.cursor_pos = None
-        screen = QApplication.primaryScreen().geometry()
-        self.setGeometry(screen)
+        m = screen_geometry().monitor()
+        self.setGeometry(m.x, m.y, m.width, m.height)
         self.showFullScreen()
         self.hide()
 
@@ -35,41 +44,36 @@ class FingerOverlay(QMainWindow):
             painter.drawLine(x, y-25, x, y+25)
 
 class FingerBlinker(QWidget):
-    def __init__(self):
+    def __init__(self, source=0, predict=None):
         super().__init__()
         self.setWindowTitle('Finger Tracking Cursor')
         self.click_count = 0
-        self.is_pinching = False
         self.init_ui()
-        self.cap = cv2.VideoCapture(0)
+        self.cap = CameraStream(source, mirror=True).start()
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_frame)
         self.timer.start(30)
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(max_num_hands=2, min_detection_confidence=0.7, min_tracking_confidence=0.7)
-        self.smoothing_alpha = 0.18  # More smoothing for less wobble
+        self.filter = OneEuroFilter(min_cutoff=0.8, beta=0.01)
+        self.predictor = Predictor()
+        self.predict = False  # lead the cursor by the pipeline latency (saved with the profile)
         self.smoothed_pos = None
         self.last_cursor_pos = None
+        self.cursor = cursor_actuator()
         self.move_threshold = 8  # Lower threshold for more frequent but smaller moves
-        self.dead_zone = 35  # Larger dead zone for less jitter
-        self.pinch_threshold = 0.07
-        self.pinch_release_threshold = 0.10
-        self.pinch_active = False
-        self.left_pinch_threshold = 0.07
-        self.left_pinch_release_threshold = 0.10
-        self.left_pinch_active = False
+        self.left_gestures = GestureEngine()  # left-hand pinch clicks
         self.overlay = FingerOverlay()
         # Calibration logic (like eye tracker)
         self.calibrated = False
         self.calibration_points = []  # [(x, y) in camera frame]
-        self.screen_points = []  # [(screen_x, screen_y)]
+        self.screen_points = []  # [(u, v) normalized screen targets]
         self.calibration_step = 0
+        self.calibration_targets = grid_targets(9)
+        self.calib = CalibrationModel()
         self.calibration_instructions = [
-            'Move your finger to the TOP-LEFT of the camera view and press SPACE',
-            'Move your finger to the TOP-RIGHT and press SPACE',
-            'Move your finger to the BOTTOM-RIGHT and press SPACE',
-            'Move your finger to the BOTTOM-LEFT and press SPACE',
-            'Move your finger to the CENTER and press SPACE',
+            f'Move your finger to the {name} of the camera view and press SPACE'
+            for name in grid_labels(9)
         ]
         self.current_instruction = QLabel(self.calibration_instructions[0])
         self.current_instruction.setAlignment(Qt.AlignCenter)
@@ -79,6 +83,16 @@ class FingerBlinker(QWidget):
         self.layout().insertWidget(1, self.calibrate_button)
         self.calibration_frames_required = 5
         self.calibration_frame_buffer = []
+        # a saved profile only needs a 1-point drift check
+        self.drift_check = False
+        self.load_profile(profiles.default_name())
+        if predict is not None:
+            self.predict = predict
+        self.predict_box = QCheckBox('Latency prediction')
+        self.predict_box.setChecked(self.predict)
+        self.predict_box.setFocusPolicy(Qt.NoFocus)  # SPACE stays with calibration
+        self.predict_box.toggled.connect(self._set_predict)
+        self.layout().addWidget(self.predict_box)
         self.setFocusPolicy(Qt.StrongFocus)
         self.dwell_time = 1.2  # Increase dwell time to 1.2 seconds for longer wait before click
         self.dwell_start_time = None
@@ -100,87 +114,114 @@ class FingerBlinker(QWidget):
         self.click_count = 0
         self.click_label.setText(f'Clicks: {self.click_count}')
 
-    def calibrate_point(self):
-        # Collect several frames to ensure stable detection
-        collected = 0
+    def sample_finger(self):
+        """Average fingertip position over a few frames, or None if the hand was lost."""
         buffer = []
         for _ in range(self.calibration_frames_required):
-            ret, frame = self.cap.read()
+            ret, frame = self.cap.read(wait=True, timeout=0.2)
             if not ret:
                 continue
-            frame = cv2.flip(frame, 1)  # Flip the frame horizontally for natural webcam view
             rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
-            if results.multi_hand_landmarks:
-                hand_landmarks = results.multi_hand_landmarks[0]
-                index_tip = hand_landmarks.landmark[8]
-                cam_x = 1 - index_tip.x  # Invert x for correct left/right
-                cam_y = index_tip.y
+            hands, _ = hand_arrays(self.hands.process(rgb_frame))
+            if hands:
+                # same feature update_frame maps (the frame is already mirrored)
+                index_tip = hands[0][INDEX_TIP]
+                cam_x = index_tip[0]
+                cam_y = index_tip[1]
                 buffer.append((cam_x, cam_y))
-                collected += 1
-        if collected == self.calibration_frames_required:
-            avg_x = sum([pt[0] for pt in buffer]) / collected
-            avg_y = sum([pt[1] for pt in buffer]) / collected
-            self.calibration_points.append((avg_x, avg_y))
-            screen_w, screen_h = pyautogui.size()
-            screen_targets = [
-                (0, 0),
-                (screen_w-1, 0),
-                (screen_w-1, screen_h-1),
-                (0, screen_h-1),
-                (screen_w//2, screen_h//2)
-            ]
-            self.screen_points.append(screen_targets[self.calibration_step])
+        if len(buffer) < self.calibration_frames_required:
+            return None
+        return tuple(float(v) for v in np.mean(buffer, axis=0))
+
+    def calibrate_point(self):
+        if self.drift_check:
+            self.check_drift()
+            return
+        sample = self.sample_finger()
+        if sample is not None:
+            self.calibration_points.append(sample)
+            self.screen_points.append(self.calibration_targets[self.calibration_step])
             self.calibration_step += 1
             if self.calibration_step < len(self.calibration_instructions):
                 self.current_instruction.setText(self.calibration_instructions[self.calibration_step])
             else:
+                self.calib = CalibrationModel().fit(self.calibration_points, self.screen_points)
                 self.calibrated = True
                 self.current_instruction.setText('Calibration complete!')
+                self.save_profile()
         else:
             self.current_instruction.setText('No hand detected, try again!')
 
+    def check_drift(self):
+        sample = self.sample_finger()
+        if sample is None:
+            self.current_instruction.setText('No hand detected, try again!')
+            return
+        ok, err = self.calib.recenter(sample)
+        self.drift_check = False
+        if ok:
+            self.calibrated = True
+            self.current_instruction.setText(f'Welcome back, {self.profile_name}! (drift {err:.3f})')
+            self.save_profile()
+        else:
+            self.calib = CalibrationModel()
+            self.current_instruction.setText(f'Calibration drifted ({err:.3f}) – '
+                                             + self.calibration_instructions[0])
+
+    def _set_predict(self, on):
+        self.predict = on
+        self.predictor.reset()
+        self.save_profile()
+
+    def save_profile(self):
+        if self.calib.fitted:
+            calibration = self.calib.to_dict()
+        else:
+            # mid-calibration: don't throw away the last good fit
+            calibration = (profiles.load(self.profile_name).get('finger') or {}).get('calibration')
+        profiles.save(self.profile_name, 'finger', {
+            'calibration': calibration,
+            'filter': filter_to_dict(self.filter),
+            'predict': self.predict,
+        })
+
+    def load_profile(self, name):
+        self.profile_name = name
+        p = profiles.load(name).get('finger') or {}
+        if 'filter' in p:
+            self.filter = filter_from_dict(p['filter'])
+        self.predict = p.get('predict', self.predict)
+        if p.get('calibration'):
+            self.calib = CalibrationModel.from_dict(p['calibration'])
+            self.drift_check = True
+            self.current_instruction.setText('Move your finger to the CENTER of the camera view and press SPACE to confirm your profile')
+
     def keyPressEvent(self, event):
         if not self.calibrated and event.key() == Qt.Key_Space:
             self.calibrate_point()
 
     def map_finger_to_screen(self, cam_x, cam_y):
-        if len(self.calibration_points) < 5:
+        if not self.calib.fitted:
             return None
-        (tl, tr, br, bl, center) = self.calibration_points
-        (stl, str_, sbr, sbl, sc) = self.screen_points
-        min_x = min([p[0] for p in [tl, tr, br, bl]])
-        max_x = max([p[0] for p in [tl, tr, br, bl]])
-        min_y = min([p[1] for p in [tl, tr, br, bl]])
-        max_y = max([p[1] for p in [tl, tr, br, bl]])
-        cam_x = max(min_x, min(max_x, cam_x))
-        cam_y = max(min_y, min(max_y, cam_y))
-        rx = (cam_x - min_x) / (max_x - min_x) if max_x != min_x else 0.5
-        ry = (cam_y - min_y) / (max_y - min_y) if max_y != min_y else 0.5
-        screen_w, screen_h = pyautogui.size()
-        sx = int(rx * (screen_w - 1))
-        sy = int(ry * (screen_h - 1))
-        return sx, sy
+        return screen_geometry().to_screen(*self.calib.map(cam_x, cam_y))
 
     def update_frame(self):
         ret, frame = self.cap.read()
         if not ret:
             return
-        frame = cv2.flip(frame, 1)
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
-        screen_w, screen_h = pyautogui.size()
-        mouse_x, mouse_y = pyautogui.position()
+        # one numpy conversion per frame; everything below works on the arrays
+        hands, labels = hand_arrays(self.hands.process(rgb_frame))
+        screen_w, screen_h = screen_geometry().size()
+        mouse_x, mouse_y = self.cursor.position()
         self.overlay.set_cursor((mouse_x, mouse_y))
         self.overlay.show()
         # Calibration mode: show fingertip indicator if detected
         if not self.calibrated:
-            if results.multi_hand_landmarks:
-                for hand_landmarks in results.multi_hand_landmarks:
-                    index_tip = hand_landmarks.landmark[8]
-                    fx = int(index_tip.x * rgb_frame.shape[1])
-                    fy = int(index_tip.y * rgb_frame.shape[0])
-                    cv2.circle(rgb_frame, (fx, fy), 18, (0, 255, 0), 3)
+            for hand in hands:
+                fx = int(hand[INDEX_TIP, 0] * rgb_frame.shape[1])
+                fy = int(hand[INDEX_TIP, 1] * rgb_frame.shape[0])
+                cv2.circle(rgb_frame, (fx, fy), 18, (0, 255, 0), 3)
             h, w, ch = rgb_frame.shape
             bytes_per_line = ch * w
             qt_image = QImage(rgb_frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
@@ -188,60 +229,46 @@ class FingerBlinker(QWidget):
             return
         right_hand = None
         left_hand = None
-        if results.multi_hand_landmarks and results.multi_handedness:
-            for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
-                label = handedness.classification[0].label
-                if label == 'Right':
-                    right_hand = hand_landmarks
-                elif label == 'Left':
-                    left_hand = hand_landmarks
+        for hand, label in zip(hands, labels):
+            if label == 'Right':
+                right_hand = hand
+            elif label == 'Left':
+                left_hand = hand
         # Cursor movement: always allow if right hand is visible
-        if right_hand:
-            index_tip = right_hand.landmark[8]
-            cam_x = index_tip.x
-            cam_y = index_tip.y
+        if right_hand is not None:
+            index_tip = right_hand[INDEX_TIP]
+            cam_x = index_tip[0]
+            cam_y = index_tip[1]
             mapped = self.map_finger_to_screen(cam_x, cam_y)
             if mapped:
-                x, y = mapped
-                if self.smoothed_pos is None:
-                    self.smoothed_pos = (x, y)
-                else:
-                    dx = x - self.smoothed_pos[0]
-                    dy = y - self.smoothed_pos[1]
-                    dist = (dx ** 2 + dy ** 2) ** 0.5
-                    if dist < self.dead_zone:
-                        self.smoothed_pos = self.smoothed_pos
-                    else:
-                        alpha = min(0.85, max(self.smoothing_alpha, dist / 300))
-                        sx = int(alpha * x + (1 - alpha) * self.smoothed_pos[0])
-                        sy = int(alpha * y + (1 - alpha) * self.smoothed_pos[1])
-                        self.smoothed_pos = (sx, sy)
+                fx, fy = self.filter.filter(mapped[0], mapped[1], self.cap.last_ts)
+                if self.predict:
+                    horizon = time.monotonic() - self.cap.last_ts + self.cursor.glide
+                    fx, fy = self.predictor.predict(fx, fy, self.cap.last_ts, horizon)
+                self.smoothed_pos = (int(fx), int(fy))
                 if self.last_cursor_pos is None or (abs(self.smoothed_pos[0] - self.last_cursor_pos[0]) > self.move_threshold or abs(self.smoothed_pos[1] - self.last_cursor_pos[1]) > self.move_threshold):
-                    pyautogui.moveTo(self.smoothed_pos[0], self.smoothed_pos[1], duration=0)
+                    self.cursor.move_to(*self.smoothed_pos)
                     self.last_cursor_pos = self.smoothed_pos
                 # Visual feedback for right hand (blue circle)
-                fx = int(index_tip.x * rgb_frame.shape[1])
-                fy = int(index_tip.y * rgb_frame.shape[0])
+                fx = int(index_tip[0] * rgb_frame.shape[1])
+                fy = int(index_tip[1] * rgb_frame.shape[0])
                 cv2.circle(rgb_frame, (fx, fy), 14, (255, 0, 0), 3)
         # Left hand pinch-to-click
-        if left_hand:
-            l_index_tip = left_hand.landmark[8]
-            l_thumb_tip = left_hand.landmark[4]
-            l_dist = ((l_index_tip.x - l_thumb_tip.x) ** 2 + (l_index_tip.y - l_thumb_tip.y) ** 2) ** 0.5
-            if l_dist < self.left_pinch_threshold and not self.left_pinch_active:
-                pyautogui.click()
+        h, w = rgb_frame.shape[:2]
+        state = self.left_gestures.update(left_hand, scale=(w, h))
+        if left_hand is not None:
+            l_index_tip = left_hand[INDEX_TIP]
+            if "pinch" in state.started:
+                self.cursor.click()
                 self.click_count += 1
                 self.click_label.setText(f'Clicks: {self.click_count}')
-                self.left_pinch_active = True
                 # Visual feedback for left hand pinch (red circle)
-                fx = int(l_index_tip.x * rgb_frame.shape[1])
-                fy = int(l_index_tip.y * rgb_frame.shape[0])
+                fx = int(l_index_tip[0] * w)
+                fy = int(l_index_tip[1] * h)
                 cv2.circle(rgb_frame, (fx, fy), 30, (0, 0, 255), 4)
-            elif l_dist > self.left_pinch_release_threshold:
-                self.left_pinch_active = False
             # Visual feedback for left hand (green circle)
-            fx = int(l_index_tip.x * rgb_frame.shape[1])
-            fy = int(l_index_tip.y * rgb_frame.shape[0])
+            fx = int(l_index_tip[0] * rgb_frame.shape[1])
+            fy = int(l_index_tip[1] * rgb_frame.shape[0])
             cv2.circle(rgb_frame, (fx, fy), 14, (0, 255, 0), 3)
         # Draw crosshair at current mouse position (visual feedback)
         # Instead of using pyautogui.position(), use self.smoothed_pos for immediate feedback
@@ -255,12 +282,15 @@ class FingerBlinker(QWidget):
         self.image_label.setPixmap(QPixmap.fromImage(qt_image))
 
     def closeEvent(self, event):
-        self.cap.release()
+        self.cap.stop()
         self.overlay.close()
         super().closeEvent(event)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
-    window = FingerBlinker()
+    # optional argument: a recorded video / image directory to replay instead of the webcam;
+    # --predict turns on latency prediction (also a checkbox, saved with the profile)
+    args = [a for a in sys.argv[1:] if a != '--predict']
+    window = FingerBlinker(args[0] if args else 0, predict=True if '--predict' in sys.argv else None)
     window.show()
     sys.exit(app.exec_())
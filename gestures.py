@@ -0,0 +1,136 @@
+# gestures.py
+"""Table-driven hand gestures over (21, 3) landmark arrays.
+
+hand_features() turns one hand into a flat vector in a single vectorized
+pass: all 10 pairwise fingertip distances and a curl per finger from its
+joint angles, plus how far the thumb tip sits above the wrist. Distances are
+in units of palm length (wrist → middle knuckle), so the thresholds don't
+change as the hand moves nearer or farther from the camera.
+
+A gesture is a row of GESTURES: a list of conditions
+
+    (feature, "<" or ">", enter, stay)
+
+that must all hold to start it (`enter`) and keep holding, against the
+looser `stay` bound, to keep it going; the gap is the hysteresis. Adding a
+gesture is one more table row: GestureEngine compiles every condition into
+flat arrays once and checks them all with a few numpy operations per frame.
+"""
+
+from collections import namedtuple
+from itertools import combinations
+
+import numpy as np
+
+from landmarks import FINGER_CHAINS, FINGER_TIPS, FINGERS, MIDDLE_MCP, THUMB_TIP, WRIST
+
+# ─ Features ──────────────────────────────────────────
+_PAIRS = list(combinations(range(len(FINGERS)), 2))
+_PAIR_A, _PAIR_B = np.array(_PAIRS).T
+# (previous, joint, next) for the three bendable joints of every finger
+_JOINTS = np.array([chain[k - 1:k + 2] for chain in FINGER_CHAINS for k in (1, 2, 3)])
+
+FEATURES = (
+    [f"{FINGERS[a]}-{FINGERS[b]}" for a, b in _PAIRS]   # tip distance / palm length
+    + [f"{f}_curl" for f in FINGERS]                     # 0 straight … ~0.5 fully bent
+    + ["thumb_up"]                                       # thumb tip above wrist / palm length
+)
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURES)}
+
+
+def hand_features(hand, scale=(1.0, 1.0)):
+    """Feature vector (see FEATURES) for one hand; `scale` = (w, h) corrects the aspect ratio."""
+    sx, sy = scale
+    p = hand[:, :3] * (sx, sy, sx)
+    size = max(float(np.linalg.norm(p[WRIST, :2] - p[MIDDLE_MCP, :2])), 1e-6)
+
+    tips = p[FINGER_TIPS, :2]
+    d = tips[_PAIR_A] - tips[_PAIR_B]
+    dist = np.sqrt((d * d).sum(-1)) / size
+
+    a = p[_JOINTS[:, 0]] - p[_JOINTS[:, 1]]
+    b = p[_JOINTS[:, 2]] - p[_JOINTS[:, 1]]
+    cos = (a * b).sum(-1) / np.maximum(np.linalg.norm(a, axis=-1) * np.linalg.norm(b, axis=-1), 1e-9)
+    curl = (1.0 - np.arccos(np.clip(cos, -1.0, 1.0)) / np.pi).reshape(len(FINGERS), 3).mean(1)
+
+    up = (p[WRIST, 1] - p[THUMB_TIP, 1]) / size
+    return np.concatenate([dist, curl, [up]])
+
+
+# ─ Gesture table ─────────────────────────────────────
+_BENT = [(f"{f}_curl", ">", 0.45, 0.35) for f in FINGERS[1:]]
+_STRAIGHT = [(f"{f}_curl", "<", 0.2, 0.3) for f in FINGERS[1:]]
+
+GESTURES = {
+    "pinch":     [("thumb-index", "<", 0.45, 0.6)],
+    "scroll":    [("index-middle", "<", 0.35, 0.45),
+                  ("index_curl", "<", 0.3, 0.4), ("middle_curl", "<", 0.3, 0.4)],
+    # fist vs thumbs-up: is the thumb tucked against the fingers or sticking out?
+    "fist":      _BENT + [("thumb-index", "<", 0.7, 0.9)],
+    "open_palm": _STRAIGHT + [("thumb-index", ">", 0.8, 0.6), ("index-middle", ">", 0.25, 0.2)],
+    "thumbs_up": _BENT + [("thumb-index", ">", 0.9, 0.7), ("thumb_curl", "<", 0.25, 0.35),
+                          ("thumb_up", ">", 1.0, 0.8)],
+}
+
+# active: gestures held this frame; started / ended: edges on this frame
+GestureState = namedtuple("GestureState", "active started ended")
+
+
+class GestureEngine:
+    """Matches one hand against a gesture table with hysteresis and debouncing.
+
+    A gesture starts after its enter conditions held for `debounce`
+    consecutive frames and ends after its stay conditions failed for as many;
+    single-frame landmark glitches therefore never toggle anything.
+    """
+
+    def __init__(self, table=GESTURES, debounce=2):
+        self.names = list(table)
+        self.debounce = debounce
+        conds = [(g, *c) for g, name in enumerate(self.names) for c in table[name]]
+        self._gesture = np.array([c[0] for c in conds])
+        self._idx = np.array([FEATURE_INDEX[c[1]] for c in conds])
+        # "a > t" is checked as "-a < -t", so every condition is one comparison
+        sign = np.array([1.0 if c[2] == "<" else -1.0 for c in conds])
+        self._sign = sign
+        self._enter = sign * np.array([c[3] for c in conds])
+        self._stay = sign * np.array([c[4] for c in conds])
+        self._starts = np.r_[0, np.flatnonzero(np.diff(self._gesture)) + 1]
+        self.reset()
+
+    def reset(self):
+        n = len(self.names)
+        self._active = np.zeros(n, bool)
+        self._streak = np.zeros(n, int)
+        self.features = None
+        self.state = GestureState(frozenset(), frozenset(), frozenset())
+
+    def value(self, feature):
+        """Last computed value of a named feature (None before the first hand)."""
+        return None if self.features is None else float(self.features[FEATURE_INDEX[feature]])
+
+    def update(self, hand, scale=(1.0, 1.0)):
+        """Feed one hand (or None when it's gone); returns the GestureState."""
+        if hand is None:
+            want = np.zeros(len(self.names), bool)
+        else:
+            self.features = hand_features(hand, scale)
+            v = self._sign * self.features[self._idx]
+            enter = np.minimum.reduceat(v < self._enter, self._starts)
+            stay = np.minimum.reduceat(v < self._stay, self._starts)
+            want = np.where(self._active, stay, enter)
+
+        # count consecutive frames that disagree with the current state
+        self._streak = np.where(want != self._active, self._streak + 1, 0)
+        flip = self._streak >= (1 if hand is None else self.debounce)
+        before = self._active.copy()
+        self._active = np.where(flip, ~self._active, self._active)
+        self._streak[flip] = 0
+
+        names = self.names
+        self.state = GestureState(
+            frozenset(n for n, a in zip(names, self._active) if a),
+            frozenset(n for n, a, b in zip(names, self._active, before) if a and not b),
+            frozenset(n for n, a, b in zip(names, self._active, before) if b and not a),
+        )
+        return self.state
@@ -4,55 +4,39 @@ import mediapipe as mp
 import time
 import pyautogui  # Import the pyautogui library
 
+from cursor import cursor_actuator
+from input_state import InputState
+from sources import open_source
+
 class ClickController:
     """Class to manage clicking functionality with the right hand"""
     def __init__(self):
         self.is_clicking = False
         self.touching_threshold = 40  # Threshold for determining if fingers are touching
+        # mouseDown/mouseUp only on real transitions, not every frame
+        self.input = InputState()
     
     def update_click_state(self, thumb_pos, index_pos):
         """Update the clicking state based on thumb and index finger positions"""
         # Calculate distance between thumb and index finger
         distance = np.sqrt((thumb_pos[0] - index_pos[0])**2 + (thumb_pos[1] - index_pos[1])**2)
         
-        # Update click state
-        prev_clicking = self.is_clicking
+        # Update click state; the button is held while fingers are touching
         self.is_clicking = distance < self.touching_threshold
-        
-        # Handle mouse button state changes
-        if self.is_clicking and not prev_clicking:
-            # Start a new click (press down)
-            pyautogui.mouseDown()
-            click_color = (0, 0, 255)  # Red when clicking
-        elif not self.is_clicking and prev_clicking:
-            # Release the click
-            pyautogui.mouseUp()
-            click_color = (0, 255, 0)  # Green when not clicking
-        else:
-            # Maintain current state
-            if self.is_clicking:
-                # Ensure mouse stays down while fingers are touching
-                self.check_and_hold_click()
-                click_color = (0, 0, 255)  # Red when clicking
-            else:
-                click_color = (0, 255, 0)  # Green when not clicking
-            
-        return click_color
-    
+        self.input.button("left", self.is_clicking)
+        self.input.flush()
+
+        return (0, 0, 255) if self.is_clicking else (0, 255, 0)  # Red when clicking
+
     def reset(self):
         """Reset the clicking state when hand is not detected"""
-        if self.is_clicking:
-            pyautogui.mouseUp()
-            self.is_clicking = False
-
-    def check_and_hold_click(self):
-        """Continuously hold mouse button down if clicking state is true"""
-        if self.is_clicking:
-            pyautogui.mouseDown()
+        self.is_clicking = False
+        self.input.release_all()
 
 class FingerTracker:
-    def __init__(self):
-        self.cap = cv2.VideoCapture(0)
+    def __init__(self, source=0):
+        # webcam index, or a recorded video / image directory to replay
+        self.cap = open_source(source)
         self.finger_position = (0, 0)
         self.is_tracking = False
         
@@ -72,6 +56,7 @@ class FingerTracker:
         
         # Create click controller for right hand
         self.click_controller = ClickController()
+        self.cursor = cursor_actuator()
 
     def track_finger(self):
         """Track the index fingertip position in the video and move cursor"""
@@ -156,7 +141,7 @@ class FingerTracker:
                         screen_y = int(y_px * self.screen_height / h)
                         
                         # Move mouse cursor to the mapped position
-                        pyautogui.moveTo(screen_x, screen_y)
+                        self.cursor.move_to(screen_x, screen_y)
                         
                         # Draw visualization for left hand (tracking hand)
                         cv2.circle(frame, (x_px, y_px), 10, (0, 255, 0), -1)  # Green for left hand index
@@ -192,6 +177,7 @@ class FingerTracker:
                 break
         
         # Clean up
+        self.click_controller.reset()
         self.cap.release()
         cv2.destroyAllWindows()
     
@@ -201,5 +187,6 @@ class FingerTracker:
 
 # Example usage
 if __name__ == "__main__":
-    tracker = FingerTracker()
+    import sys
+    tracker = FingerTracker(sys.argv[1] if len(sys.argv) > 1 else 0)
     tracker.track_finger()
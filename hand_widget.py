@@ -1,163 +1,222 @@
 # hand_widget.py
 
+import time
 import cv2
 import mediapipe as mp
-import numpy as np
 import pyautogui
 
-from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
-from PyQt5.QtCore    import Qt, QTimer
-from PyQt5.QtGui     import QImage, QPixmap
+from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QPushButton, QDialog, QFormLayout, QCheckBox
+from PyQt5.QtCore    import Qt, QTimer, pyqtSignal
+
+from cursor import cursor_actuator
+from filters import OneEuroFilter, Predictor, add_filter_rows
+from gestures import GestureEngine
+from input_state import InputState
+from landmarks import INDEX_TIP, MIDDLE_TIP, THUMB_TIP
+from latency import LatencyStats
+from preview import PreviewRenderer
+from scheduler import FrameScheduler
+from scroll import scroll_engine
+from screens import screen_geometry
+from session import VisionSession
+
+HAND_CONNECTIONS = mp.solutions.hands.HAND_CONNECTIONS
 
 class ClickController:
+    """Right-hand gestures → mouse: pinch holds the button, two-finger pinch scrolls."""
+
     def __init__(self):
+        self.gestures = GestureEngine()
+        self.input = InputState()
+        self.scroller = scroll_engine()
+        self.scroll_gain = 100.0  # scroll units per frame height of finger travel
+        self.down = False         # thumb–index pinch held
+        self.scroll_mode = False  # index–middle pinch held
+        self.last_y = None
+
+    def reset(self):
+        """Forget all gesture state and let go of the button and any scroll coast."""
+        self.gestures.reset()
         self.down = False
-        self.thresh = 40
         self.scroll_mode = False
         self.last_y = None
-
-    def update(self, thumb_pos, index_pos):
-        d = np.hypot(thumb_pos[0]-index_pos[0], thumb_pos[1]-index_pos[1])
-        prev = self.down
-        self.down = d < self.thresh
-        
-        # Handle regular clicking
-        if self.down and not prev:
-            pyautogui.mouseDown()
-        elif not self.down and prev:
-            pyautogui.mouseUp()
-        
-        # Removed reset of scroll state to fix scrolling
-        # self.scroll_mode = False
-        # self.last_y = None
-            
-    def update_with_landmarks(self, tp, ip, landmarks):
-        # First process basic click detection
-        self.update(tp, ip)
-        
-        # Check if pointer and middle fingers are pinched for scrolling
-        pointer_tip = landmarks.landmark[8]
-        middle_tip = landmarks.landmark[12]
-        pinch_distance = np.hypot(pointer_tip.x - middle_tip.x, pointer_tip.y - middle_tip.y)
-        
-        if pinch_distance < 0.05:  # Changed from 50 to 0.05 for normalized coordinates
-            # We're in scroll mode - use the position of the paired fingers for scrolling
-            if self.last_y is None:
-                self.last_y = (pointer_tip.y + middle_tip.y) / 2
-                self.scroll_mode = True
-            else:
-                # Get current y position of the pinched fingers
-                current_y = (pointer_tip.y + middle_tip.y) / 2
-                
-                # Calculate movement since last frame
-                y_diff = current_y - self.last_y
-                
-                # Scale the difference for smoother scrolling
-                scroll_amount = int(y_diff * 100)  # Increased from 200 to 1000 for better responsiveness
-                
-                # Apply scrolling - negative because moving hand down should scroll down
-                if abs(scroll_amount) > 1:  # Add threshold to avoid tiny movements
-                    pyautogui.scroll(-scroll_amount)
-                
-                # Update last position
-                self.last_y = current_y
-            
-            # Temporarily suppress clicks during scroll without disrupting click state
-            if self.down:
-                pyautogui.mouseUp()  # Release temporarily while scrolling
-                
-            self.scroll_mode = True
-        else:
-            # Not in scroll mode anymore
-            if self.scroll_mode and self.down:
-                # Restore mouse down state if needed when exiting scroll mode
-                pyautogui.mouseDown()
-            
-            # Reset scroll state
-            if self.scroll_mode:
-                self.scroll_mode = False
-                self.last_y = None
+        self.scroller.halt()
+        self.input.release_all()
+
+    def update(self, landmarks, t, scale=(1.0, 1.0)):
+        """Feed the right hand at capture time t (None when it's gone or the cursor hand is)."""
+        state = self.gestures.update(landmarks, scale)
+        self.down = "pinch" in state.active
+        self.scroll_mode = "scroll" in state.active
+        # the button is released while scrolling and pressed again afterwards
+        self.input.button("left", self.down and not self.scroll_mode)
+        self.input.flush()
+
+        if "scroll" in state.ended:
+            self.scroller.release(t)  # let the page coast on
+        if not self.scroll_mode:
+            self.last_y = None
+            return
+        # the page follows the vertical movement of the paired fingertips
+        current_y = (landmarks[INDEX_TIP, 1] + landmarks[MIDDLE_TIP, 1]) / 2
+        if self.last_y is not None:
+            # negative because moving the hand down should scroll down
+            self.scroller.drag(-(current_y - self.last_y) * self.scroll_gain, t)
+        self.last_y = current_y
 
 class HandTrackerWidget(QWidget):
-    def __init__(self):
+    # (headless, CPU ms per frame saved by skipping annotation + preview)
+    headless_changed = pyqtSignal(bool, float)
+
+    def __init__(self, session=None):
         super().__init__()
+        self._owns_session = session is None
+        self.session = session or VisionSession(kinds=("hands",))
+
         self.video = QLabel(alignment=Qt.AlignCenter)
-        QVBoxLayout(self).addWidget(self.video)
+        self.preview = PreviewRenderer(self.video)
+        self.headless = False
+        self.latency = LatencyStats()
+        self.settings_btn = QPushButton("Settings")
+        self.settings_btn.clicked.connect(self.open_settings)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.video, 1)
+        layout.addWidget(self.settings_btn)
 
         pyautogui.FAILSAFE = False
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._frame)
+        self.scheduler = FrameScheduler(self.timer)
 
         self.ctrl = ClickController()
-        self.screen_w, self.screen_h = pyautogui.size()
+        self.cursor = cursor_actuator()
+        self.filter = OneEuroFilter(min_cutoff=1.0, beta=0.01)
+        self.predictor = Predictor()
+        self.predict = False
+        self.screens = screen_geometry()
+        self.monitor_index = 0  # cursor monitor, 0 = primary
 
     def start_tracking(self):
-        self.cap = cv2.VideoCapture(0)
-        self.hands = mp.solutions.hands.Hands(
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        self.timer.start(30)
+        # the session camera is mirrored so it matches the eye‑tracker
+        self.worker = self.session.subscribe("hands", self._on_result)
+        self.cap = self.session.camera
+        self.scheduler.start()
 
     def stop_tracking(self):
-        self.timer.stop()
-        if hasattr(self, 'cap') and self.cap:
-            self.cap.release()
-            self.cap = None
+        self.scheduler.stop()
+        self.ctrl.reset()  # never leave the button held down
+        self.session.unsubscribe("hands", self._on_result)
+        if self._owns_session:
+            self.session.close()
 
     def _frame(self):
+        # hand the newest frame to the inference thread; results arrive in _on_result
         ret, fr = self.cap.read()
         if not ret:
+            self.scheduler.retry()
             return
-
-        fr = cv2.flip(fr, 1)  # mirror so it matches the eye‑tracker
+        self.latency.add("capture", self.cap.last_age * 1000.0)
+        self.latency.add("flip", self.cap.last_flip_ms)
+        self.worker.submit(fr, self.cap.last_ts)
+        self.scheduler.submitted()
+
+    def _draw_hand(self, fr, lm, w, h):
+        pts = [(int(x*w), int(y*h)) for x, y in lm[:, :2]]
+        for a, b in HAND_CONNECTIONS:
+            cv2.line(fr, pts[a], pts[b], (224,224,224), 2)
+        for p in pts:
+            cv2.circle(fr, p, 3, (0,0,255), -1)
+
+    def _on_result(self, res):
+        self.latency.add("convert", res.prep_ms)
+        self.latency.add("process", res.infer_ms - res.prep_ms)
+        t0 = time.perf_counter()
+        self.latency.begin()
+        self._process(res)
+        busy_ms = res.infer_ms + (time.perf_counter() - t0) * 1000.0
+        # capture → everything for this frame done (cursor moved, preview drawn)
+        self.latency.add("total", (time.monotonic() - res.ts) * 1000.0)
+        self.scheduler.frame_done(bool(res.hands), busy_ms)
+
+    def _process(self, res):
+        fr = res.frame
         h, w, _ = fr.shape
-        rgb = cv2.cvtColor(fr, cv2.COLOR_BGR2RGB)
-        res = self.hands.process(rgb)
 
         left_found = False
+        right_lm = None
+
+        for lm, label in zip(res.hands, res.labels):
+            ix, iy = int(lm[INDEX_TIP, 0]*w), int(lm[INDEX_TIP, 1]*h)
+
+            if label == "Left":
+                # move cursor
+                sx, sy = self.screens.to_screen(ix / w, iy / h, self.monitor_index)
+                self.latency.lap("mapping")
+                sx, sy = self.filter.filter(sx, sy, res.ts)
+                self.latency.lap("smoothing")
+                if self.predict:
+                    horizon = time.monotonic() - res.ts + self.cursor.glide
+                    sx, sy = self.predictor.predict(sx, sy, res.ts, horizon)
+                    self.latency.lap("predict")
+                self.cursor.move_to(int(sx), int(sy))
+                self.latency.lap("actuation")
+                left_found = True
+            else:
+                right_lm = lm
+
+        # right hand triggers click and scroll; lift click if no left hand present
+        self.ctrl.update(right_lm if left_found else None, res.ts, scale=(w, h))
+        self.latency.lap("click")
+
+        # headless whenever nobody can see the preview: skip all drawing
+        headless = not self.preview.visible()
+        if headless != self.headless:
+            self.headless = headless
+            self.headless_changed.emit(headless, self.preview.cost_ms)
+        if headless:
+            return
 
-        if res.multi_hand_landmarks and res.multi_handedness:
-            for lm, hd in zip(res.multi_hand_landmarks, res.multi_handedness):
-                label = hd.classification[0].label
-                ip = lm.landmark[8]  # index tip
-                tp = lm.landmark[4]  # thumb tip
-                ix, iy = int(ip.x*w), int(ip.y*h)
-                tx, ty = int(tp.x*w), int(tp.y*h)
-
-                mp.solutions.drawing_utils.draw_landmarks(
-                    fr, lm, mp.solutions.hands.HAND_CONNECTIONS
-                )
-
-                if label == "Left":
-                    # move cursor
-                    sx = int(ix * self.screen_w / w)
-                    sy = int(iy * self.screen_h / h)
-                    pyautogui.moveTo(sx, sy)
-                    cv2.circle(fr, (ix, iy), 10, (0,255,0), -1)
-                    left_found = True
-                else:
-                    # right hand triggers click and scroll
-                    self.ctrl.update_with_landmarks((tx,ty), (ix,iy), lm)  # Changed from update to update_with_landmarks
-                    
-                    # Draw line between thumb and index (for clicking)
-                    clr = (0,0,255) if self.ctrl.down else (0,255,0)
-                    cv2.line(fr, (ix,iy), (tx,ty), clr, 3)
-                    
-                    # Draw line between index and middle finger (for scrolling)
-                    middle_x, middle_y = int(lm.landmark[12].x * w), int(lm.landmark[12].y * h)
-                    scroll_distance = np.hypot(ix - middle_x, iy - middle_y)
-                    scroll_color = (255,0,0) if scroll_distance < 40 else (255,255,0)
-                    cv2.line(fr, (ix,iy), (middle_x, middle_y), scroll_color, 3)
-
-        if not left_found:
-            # lift click if no left hand present
-            self.ctrl.update((0,0),(9999,9999))
-
-        # display preview
-        h2, w2, _ = fr.shape
-        img = QImage(fr.data, w2, h2, 3*w2, QImage.Format_RGB888).rgbSwapped()
-        self.video.setPixmap(QPixmap.fromImage(img))
+        t0 = time.thread_time()
+        self.latency.begin()
+        self._annotate(fr, res, w, h)
+        self.preview.render(fr)
+        self.latency.lap("preview")
+        self.preview.add_cost(time.thread_time() - t0)
+
+    def _annotate(self, fr, res, w, h):
+        for lm, label in zip(res.hands, res.labels):
+            ix, iy = int(lm[INDEX_TIP, 0]*w), int(lm[INDEX_TIP, 1]*h)
+            tx, ty = int(lm[THUMB_TIP, 0]*w), int(lm[THUMB_TIP, 1]*h)
+
+            self._draw_hand(fr, lm, w, h)
+
+            if label == "Left":
+                cv2.circle(fr, (ix, iy), 10, (0,255,0), -1)
+            else:
+                # Draw line between thumb and index (for clicking)
+                clr = (0,0,255) if self.ctrl.down else (0,255,0)
+                cv2.line(fr, (ix,iy), (tx,ty), clr, 3)
+
+                # Draw line between index and middle finger (for scrolling)
+                middle_x, middle_y = int(lm[MIDDLE_TIP, 0] * w), int(lm[MIDDLE_TIP, 1] * h)
+                scroll_color = (255,0,0) if self.ctrl.scroll_mode else (255,255,0)
+                cv2.line(fr, (ix,iy), (middle_x, middle_y), scroll_color, 3)
+
+    def _set_predict(self, on):
+        self.predict = on
+        self.predictor.reset()
+
+    def open_settings(self):
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Settings")
+        form = QFormLayout(dlg)
+        add_filter_rows(form, self)
+        pred = QCheckBox(); pred.setChecked(self.predict)
+        pred.toggled.connect(self._set_predict)
+        form.addRow("Latency prediction:", pred)
+        btn = QPushButton("Close"); btn.clicked.connect(dlg.close)
+        form.addRow(btn)
+        dlg.exec_()
 
     def closeEvent(self, event):
         self.stop_tracking()
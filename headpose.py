@@ -0,0 +1,100 @@
+# headpose.py
+"""Head-pose-normalized gaze features from FaceMesh landmarks.
+
+The raw iris position (landmark 468) moves whenever the head does, so the
+gaze calibration only holds while the user keeps perfectly still. Here:
+
+1. cv2.solvePnP fits a rigid 3-D face model to six stable landmarks (nose
+   tip, chin, outer eye corners, mouth corners), seeded with the previous
+   frame's pose so each solve is a few refinement steps.
+2. The face mesh is rotated into that head-fixed frame, where each iris is
+   measured relative to its own eye corners, in eye widths. That is the eye's
+   rotation within the head, independent of where the head is.
+3. The eye-in-head direction is rotated back by the head pose and the gaze
+   ray is intersected with the camera plane (z = 0), giving a point in
+   millimetres that calibration maps to the screen.
+
+Only ratios and a rigid fit are used, so the feature is as stable at 320×240
+as at full resolution.
+"""
+
+import cv2
+import numpy as np
+
+from landmarks import LEFT_IRIS, RIGHT_IRIS
+
+# ─ Face model ────────────────────────────────────────
+# FaceMesh index → approximate position in mm, nose tip at the origin,
+# x to image right, y down, z away from the camera
+POSE_LANDMARKS = [1, 152, 33, 263, 61, 291]
+MODEL_POINTS = np.array([
+    (0.0, 0.0, 0.0),        # nose tip
+    (0.0, 63.6, 12.5),      # chin
+    (-43.3, -32.7, 26.0),   # eye outer corner, image left
+    (43.3, -32.7, 26.0),    # eye outer corner, image right
+    (-28.9, 28.9, 24.1),    # mouth corner, image left
+    (28.9, 28.9, 24.1),     # mouth corner, image right
+])
+EYE_ORIGIN = np.array([0.0, -32.7, 38.0])  # between the eyeballs' centres
+
+# (inner, outer) corner and iris centre for each eye
+EYE_CORNERS = [(133, 33), (362, 263)]
+EYE_IRIS = [LEFT_IRIS, RIGHT_IRIS]
+# eye width / eyeball radius: converts an iris offset in eye widths to tan(angle)
+EYE_GAIN = 2.5
+
+
+class HeadPose:
+    """Per-frame head pose and head-normalized gaze point for one face."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.rvec = None
+        self.tvec = None
+        self.R = None
+
+    def estimate(self, lm, w, h):
+        """Solve the head pose for landmarks `lm` of a w×h frame; returns success."""
+        image_points = (lm[POSE_LANDMARKS, :2] * (w, h)).astype(np.float64)
+        # focal length ≈ frame width is close enough for webcams; no distortion
+        camera = np.array([[w, 0, w / 2], [0, w, h / 2], [0, 0, 1]], dtype=np.float64)
+        guess = self.rvec is not None
+        ok, rvec, tvec = cv2.solvePnP(
+            MODEL_POINTS, image_points, camera, None,
+            rvec=self.rvec.copy() if guess else None,
+            tvec=self.tvec.copy() if guess else None,
+            useExtrinsicGuess=guess, flags=cv2.SOLVEPNP_ITERATIVE,
+        )
+        if not ok or tvec[2, 0] <= 0:
+            # lost or flipped behind the camera: start from scratch next frame
+            self.reset()
+            return False
+        self.rvec, self.tvec = rvec, tvec
+        self.R, _ = cv2.Rodrigues(rvec)
+        return True
+
+    def eye_in_head(self, lm, w, h):
+        """Mean iris offset from the eye corners in the head frame, in eye widths."""
+        u = v = 0.0
+        for (inner, outer), iris in zip(EYE_CORNERS, EYE_IRIS):
+            # pixels (FaceMesh z is on the same scale as x), rotated into the head frame
+            a, b, c = (lm[[inner, outer, iris], :3] * (w, h, w)) @ self.R
+            width = np.linalg.norm(b - a)
+            d = c - (a + b) / 2
+            u += d[0] / width
+            v += d[1] / width
+        return u / 2, v / 2
+
+    def gaze_feature(self, lm, w, h):
+        """Head-normalized gaze point (mm on the camera plane), or None."""
+        if len(lm) <= RIGHT_IRIS or not self.estimate(lm, w, h):
+            return None
+        u, v = self.eye_in_head(lm, w, h)
+        d = self.R @ np.array([EYE_GAIN * u, EYE_GAIN * v, -1.0])
+        if d[2] >= -1e-6:
+            return None  # looking away from the camera plane
+        o = self.R @ EYE_ORIGIN + self.tvec[:, 0]
+        s = -o[2] / d[2]
+        return float(o[0] + s * d[0]), float(o[1] + s * d[1])
@@ -0,0 +1,96 @@
+# hybrid_widget.py
+
+import time
+
+from PyQt5.QtCore import pyqtSignal
+
+from eye_widget import EyeTrackerWidget
+from hand_widget import ClickController
+
+
+class HybridTrackerWidget(EyeTrackerWidget):
+    """Gaze moves the cursor, a hand gesture clicks.
+
+    Everything about the gaze (calibration, profile, smoothing, prediction)
+    is the eye tracker's; blink and dwell clicks are off and the hand takes
+    over: pinch holds the button, a two‑finger pinch scrolls. FaceMesh and
+    Hands run concurrently on every captured frame through the session's
+    HybridWorker, so one frame costs the slower model, not both.
+
+    The pair's cost is checked against the frame budget (the scheduler's
+    active interval). While it runs over, Hands only runs on every 2nd or
+    3rd frame; gaze still updates on every one, and a held pinch or scroll
+    always gets fresh hand results so it is never released late.
+
+    The gaze calibration is the eye tab's: main_qt hands the newer one over
+    (share_calibration) whenever the mode switches between the two.
+    """
+    # (Hands on every n-th frame, ms the last frame took), whenever n changes
+    hands_every_changed = pyqtSignal(int, float)
+
+    MAX_HANDS_EVERY = 3
+
+    def __init__(self, session):
+        super().__init__(session)
+        self.ctrl = ClickController()
+        self.gaze_clicks = False
+        self.hands_every = 1  # run Hands on every n‑th frame
+        self._frame_no = 0
+
+    def start_tracking(self):
+        if not self.calibrated:
+            self._show_target()
+        self.worker = self.session.subscribe_hybrid(self._on_result)
+        self.cap = self.session.camera
+        self.scheduler.start()
+
+    def stop_tracking(self):
+        self.scheduler.stop()
+        self.dwell_timer.stop()
+        self.target_overlay.hide()
+        self.dwell_ring.hide()
+        self.ctrl.reset()  # let go of a held button / scroll
+        self.session.unsubscribe_hybrid(self._on_result)
+
+    def _update(self):
+        ret, frame = self.cap.read()
+        if not ret:
+            self.scheduler.retry()
+            return
+        self.latency.add("capture", self.cap.last_age * 1000.0)
+        self.latency.add("flip", self.cap.last_flip_ms)
+        self._frame_no += 1
+        hands = (self._frame_no % self.hands_every == 0
+                 or self.ctrl.down or self.ctrl.scroll_mode)
+        self.worker.submit(frame, self.cap.last_ts, hands=hands)
+        self.scheduler.submitted()
+
+    def _on_result(self, res):
+        self.latency.add("face", res.face_ms)
+        if res.hands is not None:
+            self.latency.add("hands", res.hands_ms)
+        self.latency.add("process", res.infer_ms)
+        t0 = time.perf_counter()
+        self.latency.begin()
+        self._process(res)
+        if res.hands is not None:
+            # any visible hand clicks; the gaze has the cursor
+            self.ctrl.update(res.hands[0] if res.hands else None, res.ts,
+                             scale=(res.frame.shape[1], res.frame.shape[0]))
+            self.latency.lap("click")
+        busy_ms = res.infer_ms + (time.perf_counter() - t0) * 1000.0
+        self.latency.add("total", (time.monotonic() - res.ts) * 1000.0)
+        if res.hands is not None:
+            self._fit_budget(busy_ms)
+        self.scheduler.frame_done(res.landmarks is not None or bool(res.hands), busy_ms)
+
+    def _fit_budget(self, busy_ms):
+        """Thin out Hands frames while face + hands overrun the frame budget."""
+        budget = self.scheduler.active_ms
+        if busy_ms > budget and self.hands_every < self.MAX_HANDS_EVERY:
+            self.hands_every += 1
+        elif busy_ms < 0.7 * budget and self.hands_every > 1:
+            self.hands_every -= 1
+        else:
+            return
+        self.hands_every_changed.emit(self.hands_every, busy_ms)
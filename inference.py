@@ -0,0 +1,212 @@
+# inference.py
+
+import queue
+import time
+from collections import namedtuple
+
+import cv2
+import mediapipe as mp
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from landmarks import face_array, hand_arrays
+
+# Compact per-frame results handed back to the GUI thread.
+#   ts:        monotonic capture time of the frame
+#   landmarks: (N, 3) float32 array of normalized x, y, z, or None
+#   hands:     list of (21, 3) float32 arrays, labels: matching "Left"/"Right"
+#   infer_ms:  total worker time; prep_ms: the crop + colour-convert part of it
+FaceResult  = namedtuple("FaceResult",  "frame ts landmarks infer_ms prep_ms", defaults=(0.0,))
+HandsResult = namedtuple("HandsResult", "frame ts hands labels infer_ms prep_ms", defaults=(0.0,))
+# Both models on one frame (hybrid mode). infer_ms: submit → both results back,
+# the wall-clock cost of the pair; face_ms / hands_ms: each model's own time.
+# hands/labels are None on frames where Hands was skipped.
+HybridResult = namedtuple("HybridResult", "frame ts landmarks hands labels infer_ms face_ms hands_ms")
+
+
+def face_mesh_model(profile=None):
+    """FaceMesh with iris landmarks; `profile` is an InferenceProfile (None → defaults)."""
+    if profile is None:
+        return mp.solutions.face_mesh.FaceMesh(refine_landmarks=True)
+    return mp.solutions.face_mesh.FaceMesh(
+        refine_landmarks=True,  # the eye tracker needs the iris points
+        min_detection_confidence=profile.min_detection,
+        min_tracking_confidence=profile.min_tracking,
+    )
+
+
+def hands_model(profile=None):
+    if profile is None:
+        return mp.solutions.hands.Hands(
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+    return mp.solutions.hands.Hands(
+        model_complexity=profile.model_complexity,
+        max_num_hands=profile.max_hands,
+        min_detection_confidence=profile.min_detection,
+        min_tracking_confidence=profile.min_tracking,
+    )
+
+
+class InferenceWorker(QThread):
+    """Runs a MediaPipe model off the GUI thread.
+
+    Frames go in through submit(), which never blocks: when the bounded queue
+    is full the oldest pending frame is dropped. Results come back through the
+    result_ready signal as a FaceResult or HandsResult.
+    """
+    result_ready = pyqtSignal(object)
+
+    def __init__(self, kind, model_factory=None, maxsize=1, roi=None, parent=None):
+        super().__init__(parent)
+        if kind not in ("face", "hands"):
+            raise ValueError(f"unknown inference kind: {kind!r}")
+        self.kind = kind
+        self.model_factory = model_factory or (face_mesh_model if kind == "face" else hands_model)
+        self.roi = roi  # optional RoiTracker: crop + downscale around last detection
+        self.recorder = None  # optional LandmarkRecorder, written from the worker thread
+        self._last = None  # previous result, repeated on frames the ROI switch lost
+        self._queue = queue.Queue(maxsize)
+        self._running = False
+        self.processed = 0
+        self.dropped = 0
+
+    def submit(self, frame, ts=None):
+        item = (frame, time.monotonic() if ts is None else ts)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(item)
+
+    def start(self, *args):
+        # drop anything left over (including the stop sentinel) from a previous run
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._running = True
+        super().start(*args)
+
+    def stop(self):
+        self._running = False
+        # wake the worker if it is waiting on an empty queue
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        self.wait(2000)
+
+    def run(self):
+        model = self.model_factory()
+        try:
+            while self._running:
+                item = self._queue.get()
+                if item is None or not self._running:
+                    break
+                frame, ts = item
+                result = self.process(model, frame, ts)
+                if self.recorder:
+                    self.recorder.write(result)
+                self.result_ready.emit(result)
+        finally:
+            model.close()
+
+    def process(self, model, frame, ts):
+        """Run one frame through `model` synchronously (also used by bench.py)."""
+        t0 = time.perf_counter()
+        img, box = self.roi.crop(frame) if self.roi else (frame, None)
+        rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+        prep_ms = (time.perf_counter() - t0) * 1000.0
+        res = model.process(rgb)
+        result = self._convert(frame, ts, res, 0.0)
+        if self.roi:
+            found = [result.landmarks] if self.kind == "face" else result.hands
+            self.roi.update([lm for lm in found if lm is not None], box, frame.shape)
+            if self.roi.held and self._last is not None:
+                # the model input just switched crop ↔ full frame and lost track;
+                # that isn't a real loss, so repeat the last detection this once
+                result = self._hold(result, self._last)
+        self._last = result
+        self.processed += 1
+        return result._replace(infer_ms=(time.perf_counter() - t0) * 1000.0, prep_ms=prep_ms)
+
+    def _hold(self, result, last):
+        if self.kind == "face":
+            return result._replace(landmarks=last.landmarks)
+        return result._replace(hands=[lm.copy() for lm in last.hands], labels=list(last.labels))
+
+    def _convert(self, frame, ts, res, infer_ms):
+        if self.kind == "face":
+            return FaceResult(frame, ts, face_array(res), infer_ms)
+        hands, labels = hand_arrays(res)
+        return HandsResult(frame, ts, hands, labels, infer_ms)
+
+
+class HybridWorker(QObject):
+    """Runs FaceMesh and Hands on the same frame at once and pairs the results.
+
+    It drives two already-running InferenceWorkers: submit() hands the frame
+    to both, so the models run concurrently on their own threads without a
+    second copy of either, and the two results are matched up again by
+    capture timestamp into one HybridResult. Only one frame is in flight; if a
+    worker dropped it, the next submit() abandons the pair (and counts it).
+    """
+    result_ready = pyqtSignal(object)
+
+    def __init__(self, face, hands, parent=None):
+        super().__init__(parent)
+        self.face = face
+        self.hands = hands
+        self._pending = None
+        self.attached = False
+        self.abandoned = 0
+
+    def attach(self):
+        if not self.attached:
+            self.face.result_ready.connect(self._on_face)
+            self.hands.result_ready.connect(self._on_hands)
+            self.attached = True
+
+    def detach(self):
+        if self.attached:
+            self.face.result_ready.disconnect(self._on_face)
+            self.hands.result_ready.disconnect(self._on_hands)
+            self.attached = False
+        self._pending = None
+
+    def submit(self, frame, ts, hands=True):
+        """Run both models on `frame` (just the face one with hands=False)."""
+        if self._pending is not None:
+            self.abandoned += 1
+        # False = not requested, None = not back yet
+        self._pending = {"ts": ts, "t0": time.perf_counter(), "face": None,
+                         "hands": None if hands else False}
+        self.face.submit(frame, ts)
+        if hands:
+            self.hands.submit(frame, ts)
+
+    def _on_face(self, res):
+        self._collect("face", res)
+
+    def _on_hands(self, res):
+        self._collect("hands", res)
+
+    def _collect(self, kind, res):
+        p = self._pending
+        if p is None or res.ts != p["ts"]:
+            return  # a stale frame from before the last submit
+        p[kind] = res
+        face, hands = p["face"], p["hands"]
+        if face is None or hands is None:
+            return
+        self._pending = None
+        self.result_ready.emit(HybridResult(
+            face.frame, face.ts, face.landmarks,
+            hands.hands if hands else None, hands.labels if hands else None,
+            (time.perf_counter() - p["t0"]) * 1000.0,
+            face.infer_ms, hands.infer_ms if hands else 0.0,
+        ))
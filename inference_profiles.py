@@ -0,0 +1,181 @@
+# inference_profiles.py
+"""Named MediaPipe settings and a first-launch auto-tuner that picks one.
+
+    python inference_profiles.py             # show the cached choice (tuning if there is none)
+    python inference_profiles.py --retune    # benchmark this machine again
+
+A profile sets the Hands model complexity, the camera resolution, how many
+hands to look for, the detection/tracking confidence thresholds and how far
+the ROI crop is downscaled before inference. The auto-tuner grabs a few
+camera frames, runs both models on them at every profile's settings, best
+first, and keeps the first profile that still reaches the target frame rate
+with either model alone and with both at once (hybrid mode). The choice is cached in ~/.steven/inference.json so later
+starts skip the benchmark; $STEVEN_INFERENCE_PROFILE forces a profile.
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import cv2
+
+InferenceProfile = namedtuple(
+    "InferenceProfile",
+    "name model_complexity resolution max_hands min_detection min_tracking roi_side",
+)
+
+PROFILES = {p.name: p for p in [
+    InferenceProfile("lite",     0, (320, 240),  2, 0.5, 0.5, 192),
+    InferenceProfile("balanced", 1, (640, 480),  2, 0.5, 0.5, 256),
+    InferenceProfile("accurate", 1, (1280, 720), 2, 0.7, 0.7, 384),
+]}
+BEST_FIRST = ["accurate", "balanced", "lite"]
+DEFAULT = "balanced"
+
+# bumped when the benchmark changes, so older cached choices are re-tuned
+CACHE_VERSION = 2
+CACHE_PATH = Path(os.getenv("STEVEN_INFERENCE_CACHE", Path.home() / ".steven" / "inference.json"))
+TARGET_FPS = 25.0
+
+
+# ─ Benchmark ─────────────────────────────────────────
+def grab_frames(src=0, n=20, size=None, timeout=2.0):
+    """Up to n fresh mirrored frames from the camera (fewer if it stalls)."""
+    from camera import CameraStream
+
+    cam = CameraStream(src, mirror=True, size=size).start()
+    frames = []
+    try:
+        while len(frames) < n:
+            ok, frame = cam.read(wait=True, timeout=timeout)
+            if not ok:
+                break
+            frames.append(frame)
+    finally:
+        cam.stop()
+    return frames
+
+
+def measure(profile, frames, warmup=3):
+    """Mean ms per frame under `profile`: {"face": …, "hands": …, "hybrid": …}.
+
+    face / hands time each model on its own (eye or hand mode); hybrid is
+    the wall-clock time for both on the same frame at once, the way hybrid
+    mode runs them on their two worker threads.
+    """
+    from session import make_worker
+
+    w, h = profile.resolution
+    frames = [cv2.resize(f, (w, h), interpolation=cv2.INTER_AREA) if f.shape[1] > w else f
+              for f in frames]
+    kinds = ("face", "hands")
+    workers = {kind: make_worker(kind, profile) for kind in kinds}
+    models = {kind: workers[kind].model_factory() for kind in kinds}
+    ms = {}
+    try:
+        for kind in kinds:
+            # the first frames include graph setup and a full-frame detection
+            for i, frame in enumerate(frames[:warmup]):
+                workers[kind].process(models[kind], frame, i)
+            times = [workers[kind].process(models[kind], frame, i).infer_ms
+                     for i, frame in enumerate(frames[warmup:])]
+            ms[kind] = sum(times) / len(times) if times else float("inf")
+
+        with ThreadPoolExecutor(len(kinds)) as pool:
+            times = []
+            for i, frame in enumerate(frames[warmup:]):
+                t0 = time.perf_counter()
+                jobs = [pool.submit(workers[k].process, models[k], frame, i) for k in kinds]
+                for job in jobs:
+                    job.result()
+                times.append((time.perf_counter() - t0) * 1000.0)
+        ms["hybrid"] = sum(times) / len(times) if times else float("inf")
+    finally:
+        for model in models.values():
+            model.close()
+    return ms
+
+
+def autotune(src=0, target_fps=TARGET_FPS, n=20):
+    """Benchmark every profile, best first; returns (profile, {name: fps}).
+
+    A profile has to hold the target in every mode, so its frame rate is
+    that of the heaviest load: either model alone (eye or hand mode) or both
+    at once (hybrid mode).
+    """
+    best = PROFILES[BEST_FIRST[0]]
+    # capture once at the largest size; smaller profiles see downscaled copies
+    frames = grab_frames(src, n, best.resolution)
+    if len(frames) <= 3:
+        print("Auto-tune: no camera frames, using the default inference profile")
+        return PROFILES[DEFAULT], {}
+    fps = {}
+    for name in BEST_FIRST:
+        ms = measure(PROFILES[name], frames)
+        fps[name] = 1000.0 / max(ms.values())
+        print(f"Auto-tune: {name:<9} face {ms['face']:.1f} ms, hands {ms['hands']:.1f} ms,"
+              f" both {ms['hybrid']:.1f} ms → {fps[name]:.1f} fps")
+        if fps[name] >= target_fps:
+            return PROFILES[name], fps
+    return PROFILES[BEST_FIRST[-1]], fps
+
+
+# ─ Cache ─────────────────────────────────────────────
+def load_cache():
+    try:
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable inference cache {CACHE_PATH}: {e}")
+        return {}
+
+
+def save_cache(profile, fps, target_fps):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_PATH.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump({"version": CACHE_VERSION, "profile": profile.name, "target_fps": target_fps,
+                   "fps": fps, "tuned": time.time()}, f, indent=2)
+    os.replace(tmp, CACHE_PATH)
+
+
+def select(src=0, target_fps=TARGET_FPS, retune=False):
+    """The InferenceProfile to run with: forced, cached, or freshly auto-tuned."""
+    forced = os.getenv("STEVEN_INFERENCE_PROFILE")
+    if forced:
+        if forced in PROFILES:
+            return PROFILES[forced]
+        print(f"Unknown STEVEN_INFERENCE_PROFILE {forced!r}, expected one of {', '.join(PROFILES)}")
+
+    if not str(src).isdigit():
+        # a recording says nothing about this machine's camera; use bench.py for those
+        return PROFILES[DEFAULT]
+
+    cached = load_cache()
+    if (not retune and cached.get("version") == CACHE_VERSION
+            and cached.get("profile") in PROFILES and cached.get("target_fps") == target_fps):
+        return PROFILES[cached["profile"]]
+
+    profile, fps = autotune(src, target_fps)
+    if fps:
+        save_cache(profile, fps, target_fps)
+    print(f"Inference profile: {profile.name}")
+    return profile
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--source", default=os.getenv("CAMERA_SOURCE", "0"), help="camera index")
+    ap.add_argument("--target-fps", type=float, default=TARGET_FPS)
+    ap.add_argument("--retune", action="store_true", help="ignore the cache and benchmark again")
+    args = ap.parse_args()
+
+    profile = select(args.source, args.target_fps, args.retune)
+    for k, v in profile._asdict().items():
+        print(f"{k:>16}: {v}")
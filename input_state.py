@@ -0,0 +1,71 @@
+# input_state.py
+
+from cursor import cursor_actuator
+
+
+class InputState:
+    """Logical mouse-button and key state that only sends real transitions.
+
+    Trackers declare, every frame, what should be held:
+
+        inp.button("left", pinched)
+        inp.key("shift", fist)
+        inp.flush()
+
+    and flush() compares that with what the OS was last told and sends only
+    the differences, so holding a pinch for a hundred frames is one
+    mouse_down. Requests are coalesced until flush(): a press and release in
+    the same frame cancel out. Events go through the CursorActuator, which
+    runs them in order with cursor moves and without pyautogui's pause.
+    Every request that didn't become an OS event counts as suppressed.
+    """
+
+    def __init__(self, actuator=None):
+        self.actuator = actuator or cursor_actuator()
+        self._want = {}  # ("button" | "key", name) → held
+        self._sent = {}
+        self.requests = 0
+        self.emitted = 0
+
+    def button(self, name="left", down=True):
+        self._set(("button", name), down)
+
+    def key(self, name, down=True):
+        self._set(("key", name), down)
+
+    def _set(self, ident, down):
+        self._want[ident] = bool(down)
+        self.requests += 1
+
+    def is_down(self, name="left", kind="button"):
+        """What the OS was last told about a button or key."""
+        return self._sent.get((kind, name), False)
+
+    def flush(self):
+        """Send the transitions since the last flush; returns how many."""
+        sent = 0
+        for (kind, name), down in self._want.items():
+            if self._sent.get((kind, name), False) == down:
+                continue
+            if kind == "button":
+                (self.actuator.mouse_down if down else self.actuator.mouse_up)(name)
+            else:
+                (self.actuator.key_down if down else self.actuator.key_up)(name)
+            self._sent[(kind, name)] = down
+            sent += 1
+        self._want.clear()
+        self.emitted += sent
+        return sent
+
+    def release_all(self):
+        """Let go of everything still held (tracking lost, widget closed)."""
+        for kind, name in [k for k, down in self._sent.items() if down]:
+            self._set((kind, name), False)
+        return self.flush()
+
+    @property
+    def suppressed(self):
+        return self.requests - self.emitted
+
+    def stats(self):
+        return {"requests": self.requests, "emitted": self.emitted, "suppressed": self.suppressed}
@@ -0,0 +1,120 @@
+# landmark_log.py
+"""Compact binary recordings of per-frame FaceMesh / Hands output.
+
+A file is a 64‑byte header followed by fixed‑size little‑endian records, so
+it can be opened with numpy.memmap and sliced without any parsing:
+
+    face : ts f8 | present u1 | lm f4[478, 3]
+    hands: ts f8 | count u1   | handedness i1[H] | lm f4[H, 21, 3]
+
+`handedness` is 0 for "Left", 1 for "Right" and -1 for an empty slot; H is the
+header's max_hands. Landmarks are normalized x, y, z as MediaPipe returns them.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+MAGIC = b"STVLMK\x00\x00"
+VERSION = 1
+HEADER_SIZE = 64
+_HEADER = struct.Struct("<8sHBHB")  # magic, version, kind, n_landmarks, max_hands
+
+KINDS = {"face": 0, "hands": 1}
+FACE_LANDMARKS = 478   # FaceMesh with refine_landmarks=True
+HAND_LANDMARKS = 21
+HANDEDNESS = {"Left": 0, "Right": 1}
+
+
+def record_dtype(kind, n_landmarks=None, max_hands=2):
+    if kind == "face":
+        return np.dtype([
+            ("ts", "<f8"),
+            ("present", "u1"),
+            ("lm", "<f4", (n_landmarks or FACE_LANDMARKS, 3)),
+        ])
+    return np.dtype([
+        ("ts", "<f8"),
+        ("count", "u1"),
+        ("handedness", "i1", (max_hands,)),
+        ("lm", "<f4", (max_hands, n_landmarks or HAND_LANDMARKS, 3)),
+    ])
+
+
+class LandmarkRecorder:
+    """Appends FaceResult / HandsResult records to a landmark log."""
+
+    def __init__(self, path, kind, max_hands=2):
+        if kind not in KINDS:
+            raise ValueError(f"unknown landmark kind: {kind!r}")
+        self.path = path
+        self.kind = kind
+        self.max_hands = max_hands
+        n = FACE_LANDMARKS if kind == "face" else HAND_LANDMARKS
+        self.dtype = record_dtype(kind, n, max_hands)
+        # one record reused for every write
+        self._rec = np.zeros(1, self.dtype)
+        self.frames = 0
+
+        self._f = open(path, "wb")
+        header = _HEADER.pack(MAGIC, VERSION, KINDS[kind], n, max_hands)
+        self._f.write(header.ljust(HEADER_SIZE, b"\x00"))
+
+    def write(self, result):
+        rec = self._rec[0]
+        rec["ts"] = result.ts
+        rec["lm"] = 0
+        if self.kind == "face":
+            found = result.landmarks is not None
+            rec["present"] = found
+            if found:
+                rec["lm"] = result.landmarks[:FACE_LANDMARKS]
+        else:
+            hands = result.hands[:self.max_hands]
+            rec["count"] = len(hands)
+            rec["handedness"] = -1
+            for i, (lm, label) in enumerate(zip(hands, result.labels)):
+                rec["handedness"][i] = HANDEDNESS.get(label, -1)
+                rec["lm"][i] = lm
+        self._f.write(self._rec.tobytes())
+        self.frames += 1
+
+    def close(self):
+        if self._f:
+            self._f.close()
+            self._f = None
+
+
+def read_header(path):
+    with open(path, "rb") as f:
+        raw = f.read(HEADER_SIZE)
+    magic, version, kind, n, max_hands = _HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a landmark log")
+    if version != VERSION:
+        raise ValueError(f"unsupported landmark log version {version}")
+    kind = {v: k for k, v in KINDS.items()}[kind]
+    return kind, n, max_hands
+
+
+def load(path):
+    """Memory‑map a landmark log as a structured array (read‑only, zero parsing)."""
+    kind, n, max_hands = read_header(path)
+    dtype = record_dtype(kind, n, max_hands)
+    # a session that was killed mid-write may end in a partial record; ignore it
+    count = (os.path.getsize(path) - HEADER_SIZE) // dtype.itemsize
+    if count <= 0:
+        return np.zeros(0, dtype)  # mmap can't map zero bytes
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+
+if __name__ == "__main__":
+    import sys
+    for path in sys.argv[1:]:
+        kind, n, _ = read_header(path)
+        log = load(path)
+        found = log["present"] if kind == "face" else log["count"] > 0
+        span = float(log["ts"][-1] - log["ts"][0]) if len(log) > 1 else 0.0
+        print(f"{path}: {kind}, {len(log)} frames, {span:.1f} s, "
+              f"{found.mean() * 100 if len(log) else 0:.0f}% detected")
@@ -0,0 +1,66 @@
+# landmarks.py
+"""MediaPipe results → numpy arrays, plus vectorized features over them.
+
+Every tracker converts a result once per frame with face_array / hand_arrays
+and then works on (N, 3) float32 arrays of normalized x, y, z, so the hot
+path never touches per-landmark Python objects.
+"""
+
+import numpy as np
+
+# ─ Face indices ──────────────────────────────────────
+LEFT_EYE  = [33, 160, 158, 133, 153, 144]
+RIGHT_EYE = [362, 385, 387, 263, 373, 380]
+EYES = np.array([LEFT_EYE, RIGHT_EYE])
+LEFT_IRIS, RIGHT_IRIS = 468, 473
+# EAR = (|p1-p5| + |p2-p4|) / (2 |p0-p3|), as column pairs into EYES
+_EAR_A, _EAR_B = [1, 2, 0], [5, 4, 3]
+
+# ─ Hand indices ──────────────────────────────────────
+WRIST, MIDDLE_MCP = 0, 9
+THUMB_TIP, INDEX_TIP, MIDDLE_TIP = 4, 8, 12
+FINGERS = ("thumb", "index", "middle", "ring", "pinky")
+# wrist → tip chain of each finger, in FINGERS order
+FINGER_CHAINS = np.array([[0, 1, 2, 3, 4], [0, 5, 6, 7, 8], [0, 9, 10, 11, 12],
+                          [0, 13, 14, 15, 16], [0, 17, 18, 19, 20]])
+FINGER_TIPS = FINGER_CHAINS[:, -1]
+
+
+def _to_array(landmark_list):
+    lms = landmark_list.landmark
+    flat = np.fromiter(
+        (v for p in lms for v in (p.x, p.y, p.z)), dtype=np.float32, count=3 * len(lms)
+    )
+    return flat.reshape(-1, 3)
+
+
+def face_array(results):
+    """First face of a FaceMesh result as an (N, 3) array, or None."""
+    if not results.multi_face_landmarks:
+        return None
+    return _to_array(results.multi_face_landmarks[0])
+
+
+def hand_arrays(results):
+    """([(21, 3) arrays], ["Left"/"Right" labels]) for a Hands result."""
+    if not (results.multi_hand_landmarks and results.multi_handedness):
+        return [], []
+    hands, labels = [], []
+    for lm, hd in zip(results.multi_hand_landmarks, results.multi_handedness):
+        hands.append(_to_array(lm))
+        labels.append(hd.classification[0].label)
+    return hands, labels
+
+
+def eye_aspect_ratios(lm):
+    """EAR of (left, right) eye in one pass."""
+    pts = lm[EYES, :2]                      # (2, 6, 2)
+    d = pts[:, _EAR_A] - pts[:, _EAR_B]     # (2, 3, 2)
+    dist = np.sqrt((d * d).sum(-1))         # (2, 3)
+    width = dist[:, 2]
+    return np.divide(dist[:, 0] + dist[:, 1], 2 * width,
+                     out=np.zeros(2, dist.dtype), where=width > 0)
+
+
+def mean_ear(lm):
+    return float(eye_aspect_ratios(lm).mean())
@@ -0,0 +1,79 @@
+# latency.py
+
+import csv
+import json
+import time
+
+import numpy as np
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyStats:
+    """Rolling per‑stage latency windows for one tracking pipeline.
+
+    Stages are timed with lap(): begin() stamps the monotonic clock and every
+    lap(stage) records the time since the previous stamp, so instrumenting a
+    hot path costs one perf_counter() call per stage. Durations measured
+    elsewhere (e.g. in the capture or inference thread) go in through add().
+    Each stage keeps the last `window` samples in a fixed numpy ring buffer.
+    """
+
+    def __init__(self, window=512):
+        self.window = window
+        self._buf = {}
+        self._count = {}
+        self._t = 0.0
+
+    def begin(self):
+        self._t = time.perf_counter()
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        self.add(stage, (now - self._t) * 1000.0)
+        self._t = now
+
+    def add(self, stage, ms):
+        buf = self._buf.get(stage)
+        if buf is None:
+            buf = self._buf[stage] = np.zeros(self.window)
+            self._count[stage] = 0
+        n = self._count[stage]
+        buf[n % self.window] = ms
+        self._count[stage] = n + 1
+
+    def reset(self):
+        self._buf.clear()
+        self._count.clear()
+
+    def summary(self):
+        """{stage: {"count", "mean", "p50", "p95", "p99"}} over each rolling window."""
+        out = {}
+        for stage, buf in self._buf.items():
+            n = self._count[stage]
+            data = buf[:min(n, self.window)]
+            p = np.percentile(data, PERCENTILES)
+            out[stage] = {"count": n, "mean": float(data.mean())}
+            out[stage].update({f"p{q}": float(v) for q, v in zip(PERCENTILES, p)})
+        return out
+
+    def status_text(self, stages=None):
+        """One line for the status bar: p50/p95 per stage in ms."""
+        s = self.summary()
+        parts = [
+            f"{name} {s[name]['p50']:.1f}/{s[name]['p95']:.1f}"
+            for name in (stages or s) if name in s
+        ]
+        return "p50/p95 ms  " + "  ".join(parts) if parts else ""
+
+    def to_json(self, path, **meta):
+        with open(path, "w") as f:
+            json.dump({"meta": meta, "stages": self.summary()}, f, indent=2)
+
+    def to_csv(self, path):
+        fields = ["stage", "count", "mean"] + [f"p{q}" for q in PERCENTILES]
+        with open(path, "w", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=fields)
+            w.writeheader()
+            for stage, row in self.summary().items():
+                w.writerow({"stage": stage, **{k: round(v, 3) for k, v in row.items()}})
@@ -2,19 +2,25 @@
 
 import sys
 import os
+import time
 import threading
 from pathlib import Path
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QStackedWidget,
     QAction, QActionGroup, QToolBar, QStatusBar,
-    QToolButton, QShortcut
+    QToolButton, QShortcut, QLabel
 )
 from PyQt5.QtGui import QIcon, QFont, QKeySequence
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QTimer
 
+from cursor import cursor_actuator
 from eye_widget import EyeTrackerWidget
 from hand_widget import HandTrackerWidget
+from hybrid_widget import HybridTrackerWidget
+import inference_profiles
+from scroll import scroll_engine
+from session import VisionSession
 import audio  # your voice assistant module
 
 class ListeningOverlay(QToolButton):
@@ -46,6 +52,13 @@ class ListeningOverlay(QToolButton):
         self.move(geom.right() - self.width() - 20, geom.top() + 20)
         self.show()
 
+def parse_resolution(text):
+    """'320x240' → (320, 240); None/empty → None (camera default)."""
+    if not text:
+        return None
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -53,16 +66,38 @@ class MainWindow(QMainWindow):
         self.resize(1000, 700)
         self._collapsed = False
 
+        # one camera + preloaded FaceMesh/Hands shared by both tabs,
+        # so switching modes never reopens the camera or rebuilds a model
+        # model settings from the first-launch auto-tuner (cached afterwards)
+        src = os.getenv("CAMERA_SOURCE", "0")
+        self.session  = VisionSession(
+            src,
+            use_roi=os.getenv("ROI_CROP") == "1",
+            record_dir=os.getenv("LANDMARK_LOG_DIR"),
+            resolution=parse_resolution(os.getenv("CAMERA_RESOLUTION")),
+            profile=inference_profiles.select(src),
+        ).start()
+
         # central stack
         self.stack    = QStackedWidget()
-        self.eye_tab  = EyeTrackerWidget()
-        self.hand_tab = HandTrackerWidget()
+        self.eye_tab  = EyeTrackerWidget(self.session)
+        self.hand_tab = HandTrackerWidget(self.session)
+        # gaze moves the cursor, a hand gesture clicks
+        self.hybrid_tab = HybridTrackerWidget(self.session)
         self.stack.addWidget(self.eye_tab)
         self.stack.addWidget(self.hand_tab)
+        self.stack.addWidget(self.hybrid_tab)
         self.setCentralWidget(self.stack)
 
         # collapse on calibration
         self.eye_tab.calibration_complete.connect(self._collapse_to_corner)
+        self.hybrid_tab.calibration_complete.connect(self._collapse_to_corner)
+
+        # trackers drop all drawing work while no preview is visible
+        self.eye_tab.headless_changed.connect(self._on_headless_changed)
+        self.hand_tab.headless_changed.connect(self._on_headless_changed)
+        self.hybrid_tab.headless_changed.connect(self._on_headless_changed)
+        self.hybrid_tab.hands_every_changed.connect(self._on_hands_every_changed)
 
         # overlay badge
         self.listen_overlay = ListeningOverlay()
@@ -90,6 +125,12 @@ class MainWindow(QMainWindow):
         mode_group.addAction(act_hand)
         tb.addAction(act_hand)
 
+        act_hybrid = QAction(eye_icon, "Hybrid Control", self, checkable=True)
+        act_hybrid.setToolTip("Look to move the cursor, pinch to click")
+        act_hybrid.triggered.connect(lambda: self._switch_mode(2))
+        mode_group.addAction(act_hybrid)
+        tb.addAction(act_hybrid)
+
         mic_btn = QToolButton(self)
         mic_btn.setIcon(QIcon(str(Path(__file__).parent / "icons/mic.svg")))
         mic_btn.setIconSize(QSize(32,32))
@@ -100,6 +141,15 @@ class MainWindow(QMainWindow):
         self._switch_mode(0)
         self.setStatusBar(QStatusBar(self))
 
+        # per-stage latency of the active tracker, refreshed once a second
+        self.latency_label = QLabel()
+        self.statusBar().addPermanentWidget(self.latency_label)
+        self._latency_timer = QTimer(self)
+        self._latency_timer.timeout.connect(self._refresh_latency)
+        self._latency_timer.start(1000)
+        self._export_sc = QShortcut(QKeySequence("Ctrl+E"), self)
+        self._export_sc.activated.connect(self._export_latency)
+
         # Q shortcut as application‑wide
         self._restart_sc = QShortcut(QKeySequence("Q"), self)
         self._restart_sc.setContext(Qt.ApplicationShortcut)
@@ -120,17 +170,59 @@ class MainWindow(QMainWindow):
     def _switch_mode(self, index: int):
         self.eye_tab.stop_tracking()
         self.hand_tab.stop_tracking()
+        self.hybrid_tab.stop_tracking()
         self.stack.setCurrentIndex(index)
+        # eye and hybrid share one gaze calibration: bring over the newer one
         if index == 0:
+            self.eye_tab.share_calibration(self.hybrid_tab)
             self.eye_tab.start_tracking()
             self.statusBar().showMessage("👁  Eye Control Mode", 2000)
-        else:
+        elif index == 1:
             self.hand_tab.start_tracking()
             self.statusBar().showMessage("✋  Hand Control Mode", 2000)
             self._collapse_to_corner()
+        else:
+            self.hybrid_tab.share_calibration(self.eye_tab)
+            self.hybrid_tab.start_tracking()
+            self.statusBar().showMessage("👁✋  Hybrid Control Mode", 2000)
         self.listen_overlay.raise_()
         self.listen_overlay.show()
 
+    def _refresh_latency(self):
+        tab = self.stack.currentWidget()
+        text = tab.latency.status_text(("capture", "process", "total"))
+        dropped = self.session.camera.stats()["dropped"]
+        self.latency_label.setText(f"{text}  dropped {dropped}" if text else "")
+
+    def _export_latency(self):
+        """Ctrl+E: dump the active tracker's latency percentiles as JSON + CSV."""
+        tab = self.stack.currentWidget()
+        mode = {self.eye_tab: "eye", self.hand_tab: "hand"}.get(tab, "hybrid")
+        base = f"latency_{mode}_{time.strftime('%Y%m%d-%H%M%S')}"
+        # hand clicking: how many redundant button events the input layer dropped
+        extra = {"input": tab.ctrl.input.stats()} if mode != "eye" else {}
+        if mode == "hybrid":
+            extra.update(hands_every=tab.hands_every, abandoned=tab.worker.abandoned)
+        tab.latency.to_json(base + ".json", mode=mode, predict=tab.predict,
+                            camera=self.session.camera.stats(), **extra)
+        tab.latency.to_csv(base + ".csv")
+        self.statusBar().showMessage(f"Latency exported to {base}.json / {base}.csv", 3000)
+
+    def _on_headless_changed(self, headless, saved_ms):
+        if headless:
+            msg = f"Headless tracking: saving ~{saved_ms:.1f} ms CPU per frame"
+        else:
+            msg = "Preview visible: tracking with rendering"
+        self.statusBar().showMessage(msg, 3000)
+
+    def _on_hands_every_changed(self, every, busy_ms):
+        if every == 1:
+            msg = f"Hybrid: {busy_ms:.1f} ms per frame, Hands on every frame"
+        else:
+            msg = (f"Hybrid: {busy_ms:.1f} ms per frame, over budget:"
+                   f" Hands on every {every} frames")
+        self.statusBar().showMessage(msg, 3000)
+
     def _collapse_to_corner(self):
         if self._collapsed:
             return
@@ -152,6 +244,10 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         self.eye_tab.stop_tracking()
         self.hand_tab.stop_tracking()
+        self.hybrid_tab.stop_tracking()
+        self.session.close()
+        cursor_actuator().stop()
+        scroll_engine().stop()
         self.listen_overlay.hide()
         event.accept()
 
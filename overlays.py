@@ -0,0 +1,93 @@
+# overlays.py
+
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush
+
+from screens import screen_geometry
+
+
+class ScreenOverlay(QWidget):
+    """Transparent, click‑through, always‑on‑top window covering the screen."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setAttribute(Qt.WA_ShowWithoutActivating)
+        m = screen_geometry().monitor()
+        self.setGeometry(m.x, m.y, m.width, m.height)
+
+
+class TargetOverlay(ScreenOverlay):
+    """Shows the calibration point the user should look at / point to."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.target = None  # (x, y) in global screen pixels
+
+    def show_target(self, x, y):
+        self.target = (x, y)
+        m = screen_geometry().monitor_at(x, y)
+        self.setGeometry(m.x, m.y, m.width, m.height)
+        self.show()
+        self.raise_()
+        self.update()
+
+    def paintEvent(self, event):
+        if not self.target:
+            return
+        x, y = self.target[0] - self.x(), self.target[1] - self.y()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(255, 255, 255, 220), 3))
+        painter.setBrush(QBrush(QColor(230, 60, 60, 220)))
+        painter.drawEllipse(x - 14, y - 14, 28, 28)
+        painter.setBrush(QBrush(QColor(255, 255, 255)))
+        painter.drawEllipse(x - 3, y - 3, 6, 6)
+
+
+class DwellRing(ScreenOverlay):
+    """Progress ring around the dwell point; fills up as the dwell runs."""
+
+    RADIUS = 22
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pos = None       # (x, y) in global screen pixels
+        self.progress = 0.0
+
+    def _rect(self, pos):
+        r = self.RADIUS + 4
+        return QRect(pos[0] - self.x() - r, pos[1] - self.y() - r, 2 * r, 2 * r)
+
+    def set_progress(self, pos, progress):
+        if progress <= 0.0:
+            if self.progress > 0.0:
+                self.progress = 0.0
+                self.update(self._rect(self.pos))
+            return
+        if pos != self.pos and self.pos is not None:
+            self.update(self._rect(self.pos))
+        self.pos, self.progress = (int(pos[0]), int(pos[1])), progress
+        if not self.isVisible() or not self.geometry().contains(*self.pos):
+            m = screen_geometry().monitor_at(*self.pos)
+            self.setGeometry(m.x, m.y, m.width, m.height)
+            self.show()
+        # only repaint the ring's own square, not the whole screen
+        self.update(self._rect(self.pos))
+
+    def paintEvent(self, event):
+        if self.pos is None or self.progress <= 0.0:
+            return
+        rect = self._rect(self.pos).adjusted(4, 4, -4, -4)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(QColor(255, 255, 255, 90), 4))
+        painter.drawEllipse(rect)
+        pen = QPen(QColor(60, 160, 255, 230), 4)
+        pen.setCapStyle(Qt.RoundCap)
+        painter.setPen(pen)
+        # Qt angles are 1/16 degree, counter‑clockwise from 3 o'clock
+        painter.drawArc(rect, 90 * 16, -int(self.progress * 360 * 16))
@@ -0,0 +1,74 @@
+# preview.py
+
+import cv2
+import numpy as np
+
+from PyQt5.QtWidgets import QSizePolicy
+from PyQt5.QtGui import QImage, QPixmap
+
+# Qt ≥ 5.14 reads OpenCV's BGR layout directly; older Qt needs one cvtColor
+_BGR888 = getattr(QImage, "Format_BGR888", None)
+
+
+class PreviewRenderer:
+    """Draws BGR camera frames into a QLabel at the label's own size.
+
+    Frames are downsampled to the label before any Qt conversion, into buffers
+    that are reused between frames, and nothing at all is done while the label
+    is hidden (e.g. after the main window collapses to the corner).
+    """
+
+    def __init__(self, label):
+        self.label = label
+        # the pixmap must never drive the label's size, or it could only grow
+        label.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Ignored)
+        label.setMinimumSize(1, 1)
+        self._small = None
+        self._rgb = None
+        self.rendered = 0
+        self.skipped = 0
+        # EMA of the per-frame CPU time spent on annotation + rendering,
+        # i.e. what headless mode saves while the preview is hidden
+        self.cost_ms = 0.0
+
+    def visible(self):
+        label = self.label
+        return label.isVisible() and not label.visibleRegion().isEmpty()
+
+    def add_cost(self, seconds, alpha=0.1):
+        ms = seconds * 1000.0
+        self.cost_ms = ms if not self.cost_ms else alpha * ms + (1 - alpha) * self.cost_ms
+
+    def render(self, frame):
+        if not self.visible():
+            self.skipped += 1
+            return False
+
+        dpr = self.label.devicePixelRatioF()
+        lw, lh = self.label.width() * dpr, self.label.height() * dpr
+        h, w = frame.shape[:2]
+        # fit inside the label, keep the aspect ratio, never upscale
+        scale = min(lw / w, lh / h, 1.0)
+        tw, th = max(1, int(w * scale)), max(1, int(h * scale))
+
+        if (tw, th) == (w, h):
+            small = frame
+        else:
+            if self._small is None or self._small.shape[:2] != (th, tw):
+                self._small = np.empty((th, tw, 3), np.uint8)
+            cv2.resize(frame, (tw, th), dst=self._small, interpolation=cv2.INTER_AREA)
+            small = self._small
+
+        if _BGR888 is not None:
+            img = QImage(small.data, tw, th, small.strides[0], _BGR888)
+        else:
+            if self._rgb is None or self._rgb.shape[:2] != (th, tw):
+                self._rgb = np.empty((th, tw, 3), np.uint8)
+            cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            img = QImage(self._rgb.data, tw, th, self._rgb.strides[0], QImage.Format_RGB888)
+
+        pix = QPixmap.fromImage(img)  # copies, so our buffers can be reused next frame
+        pix.setDevicePixelRatio(dpr)
+        self.label.setPixmap(pix)
+        self.rendered += 1
+        return True
@@ -0,0 +1,65 @@
+# profiles.py
+"""Named per-user profiles: calibration, blink statistics and tracker settings.
+
+One JSON file per profile in ~/.steven/profiles (override with
+STEVEN_PROFILE_DIR), holding one section per tracker ("eye", "finger", …)
+so each tracker only reads and writes its own part. The profile used at
+startup is $STEVEN_PROFILE, or the OS user name.
+"""
+
+import getpass
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+PROFILE_DIR = Path(os.getenv("STEVEN_PROFILE_DIR", Path.home() / ".steven" / "profiles"))
+VERSION = 1
+
+
+def default_name():
+    return os.getenv("STEVEN_PROFILE") or getpass.getuser() or "default"
+
+
+def _path(name):
+    safe = re.sub(r"[^\w.-]+", "_", name.strip()) or "default"
+    return PROFILE_DIR / f"{safe}.json"
+
+
+def names():
+    """Saved profile names, alphabetically."""
+    if not PROFILE_DIR.is_dir():
+        return []
+    return sorted(p.stem for p in PROFILE_DIR.glob("*.json"))
+
+
+def load(name):
+    """The whole profile as a dict; {} if it doesn't exist or can't be read."""
+    path = _path(name)
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable profile {path}: {e}")
+        return {}
+    if data.get("version") != VERSION:
+        print(f"Ignoring profile {path}: version {data.get('version')}, expected {VERSION}")
+        return {}
+    return data
+
+
+def save(name, section, data):
+    """Replace one tracker's section of a profile, keeping the others."""
+    profile = load(name)
+    profile.update({"version": VERSION, "name": name, "saved": time.time(), section: data})
+    path = _path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # write‑then‑rename so a crash mid‑save never leaves a truncated profile
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(profile, f, indent=2)
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,112 @@
+# roi.py
+
+import cv2
+import numpy as np
+
+
+class RoiTracker:
+    """Crops each frame around the previous face/hand box before inference.
+
+    The crop is the bounding box of last frame's landmarks plus padding,
+    downscaled so its longer side is at most `max_side` pixels. It is only
+    used while all `max_count` faces/hands the model looks for are tracked:
+    with fewer, a new one can enter anywhere, so the model sees the full frame.
+    With all of them tracked the model can't take on another one anyway, so
+    no periodic full-frame refresh is needed.
+
+    MediaPipe's video-mode graphs track from the previous frame's ROI in that
+    input image's normalized coordinates. Every change of input frame (crop ↔
+    full frame, or a moved box) puts that ROI in the wrong place, so the box
+    only moves once the landmarks leave it, and the first crop after a full
+    frame gets a second chance before the crop is given up. `held` flags a
+    frame whose input just switched and that found fewer faces/hands than the
+    one before: the worker repeats the previous detection for it instead of
+    reporting the switch as a lost hand.
+
+    Off by default (VisionSession / make_worker use_roi): the video-mode graphs
+    already track on their own internal ROI, and on the clips measured so far
+    the crop saved no inference time (see `bench.py --roi`).
+    """
+
+    def __init__(self, padding=0.25, max_side=256, min_side=64, max_count=1):
+        self.padding = padding
+        self.max_side = max_side
+        self.min_side = min_side
+        self.max_count = max_count
+        self.box = None  # (x0, y0, x1, y1) in full-frame pixels
+        self.count = 0   # faces/hands found in the last frame
+        self.reframed = False  # the input just switched crop ↔ full frame
+        self.held = False
+        self._was_full = True
+
+        # ─ Stats ─────────────────────────────────────────
+        self.full_frames = 0
+        self.roi_frames = 0
+
+    def reset(self):
+        self.box = None
+        self.count = 0
+
+    def crop(self, frame):
+        """Return (image, box): the image to run the model on and its box in `frame` pixels."""
+        h, w = frame.shape[:2]
+        full = self.box is None or self.count < self.max_count
+        self.reframed, self._was_full = full != self._was_full, full
+        if full:
+            self.full_frames += 1
+            return frame, (0, 0, w, h)
+
+        self.roi_frames += 1
+        x0, y0, x1, y1 = self.box
+        img = frame[y0:y1, x0:x1]
+        scale = self.max_side / max(x1 - x0, y1 - y0)
+        if scale < 1:
+            img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        return img, self.box
+
+    def update(self, arrays, box, frame_shape):
+        """Map crop-normalized landmark arrays back to full-frame coordinates (in place)
+        and derive the next crop box from them."""
+        self.held = self.reframed and len(arrays) < self.count
+        if not arrays:
+            if self.held and not self._was_full:
+                # the first crop after a full frame: the graph's tracked ROI was in
+                # full-frame coordinates, so give it one more frame in the crop
+                return
+            self.box = None
+            self.count = 0
+            return
+        self.count = len(arrays)
+        h, w = frame_shape[:2]
+        x0, y0, x1, y1 = box
+        for lm in arrays:
+            lm[:, 0] = (x0 + lm[:, 0] * (x1 - x0)) / w
+            lm[:, 1] = (y0 + lm[:, 1] * (y1 - y0)) / h
+            # z is in units of the input image's width, like x
+            lm[:, 2] *= (x1 - x0) / w
+
+        pts = np.concatenate([lm[:, :2] for lm in arrays])
+        (mnx, mny), (mxx, mxy) = pts.min(0), pts.max(0)
+        # square box in pixels around the landmarks, padded on every side
+        cx, cy = (mnx + mxx) / 2 * w, (mny + mxy) / 2 * h
+        side = max((mxx - mnx) * w, (mxy - mny) * h) * (1 + 2 * self.padding)
+        side = max(side, self.min_side)
+        half = side / 2
+        if self._keep(mnx * w, mny * h, mxx * w, mxy * h, side):
+            # every move of the box shifts the graph's coordinates; keep it while it fits
+            return
+        bx0, by0 = max(0, int(cx - half)), max(0, int(cy - half))
+        bx1, by1 = min(w, int(cx + half)), min(h, int(cy + half))
+        if bx1 - bx0 < 2 or by1 - by0 < 2:
+            self.box = None
+        else:
+            self.box = (bx0, by0, bx1, by1)
+
+    def _keep(self, x0, y0, x1, y1, side):
+        """Whether landmarks spanning (x0, y0)–(x1, y1) still fit the current box."""
+        if self.box is None or self._was_full:
+            return False
+        bx0, by0, bx1, by1 = self.box
+        margin = (bx1 - bx0) * self.padding / (1 + 2 * self.padding) / 2
+        return (x0 - bx0 >= margin and y0 - by0 >= margin and bx1 - x1 >= margin
+                and by1 - y1 >= margin and side >= 0.7 * (bx1 - bx0))
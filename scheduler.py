@@ -0,0 +1,81 @@
+# scheduler.py
+
+import time
+
+
+class FrameScheduler:
+    """Paces a tracker's QTimer instead of a fixed timer.start(30).
+
+    The timer is single‑shot and only re‑armed once the previous frame's
+    result has been handled, so ticks can never pile up behind slow inference.
+    The next tick is scheduled at:
+      - `active_ms` while a face/hand is in view,
+      - `idle_ms` once nothing has been detected for `idle_after` seconds
+        (and straight back to `active_ms` on the next detection),
+      - a backed‑off interval when per‑frame work overruns the budget,
+        easing back down as soon as there is headroom again.
+    """
+
+    def __init__(self, timer, active_ms=30, idle_ms=200, idle_after=2.0,
+                 max_ms=250, backoff=1.5, recover=0.9, watchdog_ms=1000):
+        self.timer = timer
+        self.timer.setSingleShot(True)
+        self.active_ms = active_ms
+        self.idle_ms = idle_ms
+        self.idle_after = idle_after
+        self.max_ms = max_ms
+        self.backoff = backoff
+        self.recover = recover
+        self.watchdog_ms = watchdog_ms
+
+        self.interval_ms = active_ms
+        self.busy_ms = 0.0
+        self.idle = False
+        self.running = False
+        self._last_detect = time.monotonic()
+        self._tick_ts = 0.0
+
+    def start(self):
+        self.running = True
+        self._last_detect = time.monotonic()
+        self.interval_ms = self.active_ms
+        self.idle = False
+        self.timer.start(0)
+
+    def stop(self):
+        self.running = False
+        self.timer.stop()
+
+    def retry(self, delay_ms=5):
+        """No new camera frame yet: poll again shortly."""
+        self.timer.start(delay_ms)
+
+    def submitted(self):
+        """A frame went to inference; wait for frame_done, but never forever."""
+        self._tick_ts = time.monotonic()
+        self.timer.start(self.watchdog_ms)
+
+    def frame_done(self, detected, busy_ms):
+        if not self.running:
+            # a result that was already in flight when tracking stopped
+            return
+        now = time.monotonic()
+        self.busy_ms = busy_ms
+
+        if detected:
+            self._last_detect = now
+        was_idle = self.idle
+        self.idle = now - self._last_detect > self.idle_after
+        target = self.idle_ms if self.idle else self.active_ms
+
+        if busy_ms > self.interval_ms:
+            # over budget: give the CPU room instead of running back-to-back
+            self.interval_ms = min(self.max_ms, max(target, busy_ms * self.backoff))
+        elif self.idle != was_idle or self.interval_ms < target:
+            # entering/leaving idle switches rate immediately
+            self.interval_ms = target
+        else:
+            self.interval_ms = max(target, self.interval_ms * self.recover)
+
+        elapsed_ms = (now - self._tick_ts) * 1000.0
+        self.timer.start(max(0, int(self.interval_ms - elapsed_ms)))
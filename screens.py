@@ -0,0 +1,107 @@
+# screens.py
+
+from collections import namedtuple
+
+from PyQt5.QtCore import QObject, QRect, pyqtSignal
+from PyQt5.QtGui import QGuiApplication
+
+# x, y, width, height are in the coordinates the OS cursor (pyautogui) uses;
+# scale is the monitor's device pixel ratio (DPI scale); refresh is in Hz.
+Monitor = namedtuple("Monitor", "index name x y width height scale refresh primary")
+
+
+class ScreenGeometry(QObject):
+    """Cached virtual‑desktop layout: per‑monitor rectangles and DPI scale.
+
+    Built lazily from QScreen and only rebuilt when Qt reports a screen being
+    added, removed, or changing geometry / DPI, so per‑frame lookups are plain
+    attribute reads instead of an OS round trip like pyautogui.size().
+    """
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._monitors = None
+        self._virtual = None
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self.invalidate)
+        app.primaryScreenChanged.connect(self.invalidate)
+        for screen in app.screens():
+            self._watch(screen)
+
+    def _watch(self, screen):
+        screen.geometryChanged.connect(self.invalidate)
+        screen.logicalDotsPerInchChanged.connect(self.invalidate)
+
+    def _on_screen_added(self, screen):
+        self._watch(screen)
+        self.invalidate()
+
+    def invalidate(self, *_):
+        self._monitors = None
+        self._virtual = None
+        self.changed.emit()
+
+    def _build(self):
+        app = QGuiApplication.instance()
+        primary = app.primaryScreen()
+        monitors = []
+        virtual = QRect()
+        for i, screen in enumerate(app.screens()):
+            g = screen.geometry()
+            monitors.append(Monitor(i, screen.name(), g.x(), g.y(), g.width(), g.height(),
+                                    screen.devicePixelRatio(), screen.refreshRate(),
+                                    screen is primary))
+            virtual = virtual.united(g)
+        # keep the primary monitor first so index 0 is always a sane default
+        monitors.sort(key=lambda m: not m.primary)
+        self._monitors = [m._replace(index=i) for i, m in enumerate(monitors)]
+        self._virtual = (virtual.x(), virtual.y(), virtual.width(), virtual.height())
+
+    @property
+    def monitors(self):
+        if self._monitors is None:
+            self._build()
+        return self._monitors
+
+    @property
+    def virtual(self):
+        """(x, y, width, height) of the bounding box of all monitors."""
+        if self._virtual is None:
+            self._build()
+        return self._virtual
+
+    def monitor(self, index=None):
+        """Monitor by index (None or out of range → primary)."""
+        mons = self.monitors
+        if index is None or not 0 <= index < len(mons):
+            return mons[0]
+        return mons[index]
+
+    def monitor_at(self, x, y):
+        for m in self.monitors:
+            if m.x <= x < m.x + m.width and m.y <= y < m.y + m.height:
+                return m
+        return self.monitors[0]
+
+    def size(self, index=None):
+        """Drop‑in for pyautogui.size(), for any monitor (primary by default)."""
+        m = self.monitor(index)
+        return m.width, m.height
+
+    def to_screen(self, u, v, index=None):
+        """Normalized (u, v) on a monitor → global cursor coordinates."""
+        m = self.monitor(index)
+        return int(m.x + u * (m.width - 1)), int(m.y + v * (m.height - 1))
+
+
+_instance = None
+
+
+def screen_geometry():
+    """The shared ScreenGeometry (needs a running QGuiApplication)."""
+    global _instance
+    if _instance is None:
+        _instance = ScreenGeometry()
+    return _instance
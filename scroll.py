@@ -0,0 +1,148 @@
+# scroll.py
+
+import math
+import threading
+import time
+
+import pyautogui
+
+
+class ScrollEngine:
+    """Smooth scrolling with momentum, emitted from its own thread.
+
+    Two ways in:
+
+    - drag(delta, t) while a hand holds the scroll gesture: the page follows
+      the fingers exactly; release() then lets it coast with the fingers'
+      last velocity, slowed by `friction` (1/s, exponential decay).
+    - fling(distance) for a voice command: starts a coast that travels
+      exactly `distance` units in total (v0 = distance · friction).
+
+    The thread wakes `hz` times a second while anything is moving and adds
+    that tick's travel to a fractional accumulator, sending only its whole
+    part. Slow drags therefore add up instead of being rounded away, and the
+    scroll rate doesn't depend on the camera's frame rate. Units are
+    pyautogui.scroll()'s (wheel units on Windows, lines on macOS).
+    """
+
+    def __init__(self, hz=60.0, friction=5.0, min_speed=20.0, max_speed=20000.0, release_window=0.25):
+        self.hz = hz
+        self.friction = friction
+        self.min_speed = min_speed        # units/s below which a coast stops
+        self.max_speed = max_speed
+        self.release_window = release_window  # older drag samples carry no momentum
+
+        self._cond = threading.Condition()
+        self._pending = 0.0   # dragged but not yet sent
+        self._velocity = 0.0  # coasting speed, units/s
+        self._acc = 0.0       # fractional part carried between ticks
+        self._drag_t = None
+        self._drag_v = 0.0    # smoothed drag velocity
+
+        self._thread = None
+        self._running = False
+
+        # ─ Stats ─────────────────────────────────────────
+        self.events = 0
+        self.units = 0
+
+    def start(self):
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name="ScrollEngine", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._running = False
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    # ─ Called from tracker / voice threads ─────────────
+    def drag(self, delta, t):
+        """Scroll by `delta` units now (fingers moved at time t); stops any coast."""
+        with self._cond:
+            if self._drag_t is not None and t > self._drag_t:
+                v = delta / (t - self._drag_t)
+                self._drag_v += 0.5 * (v - self._drag_v)
+            self._drag_t = t
+            self._velocity = 0.0
+            self._pending += delta
+            self._cond.notify()
+
+    def release(self, t=None):
+        """The drag ended: coast on with its velocity if it was still moving."""
+        t = time.monotonic() if t is None else t
+        with self._cond:
+            if self._drag_t is not None and t - self._drag_t <= self.release_window:
+                self._velocity = max(-self.max_speed, min(self.max_speed, self._drag_v))
+            self._drag_t = None
+            self._drag_v = 0.0
+            self._cond.notify()
+
+    def fling(self, distance):
+        """Coast `distance` units in total, fast at first and easing out."""
+        with self._cond:
+            self._velocity += distance * self.friction
+            self._cond.notify()
+
+    def halt(self):
+        with self._cond:
+            self._velocity = self._pending = 0.0
+            self._drag_t = None
+            self._drag_v = 0.0
+
+    def stats(self):
+        with self._cond:
+            return {"events": self.events, "units": self.units}
+
+    # ─ Scroll thread ────────────────────────────────────
+    def _loop(self):
+        last = time.monotonic()
+        while self._running:
+            with self._cond:
+                # sleep until something moves
+                if not self._pending and not self._velocity:
+                    self._cond.wait_for(lambda: self._pending or self._velocity or not self._running)
+                    last = time.monotonic()
+                now = time.monotonic()
+                dt, last = min(now - last, 2.0 / self.hz), now
+
+                step, self._pending = self._pending, 0.0
+                if self._velocity:
+                    # exact integral of v·e^(-friction·t) over this tick
+                    decay = math.exp(-self.friction * dt)
+                    step += self._velocity * (1.0 - decay) / self.friction
+                    self._velocity *= decay
+                    if abs(self._velocity) < self.min_speed:
+                        # what's left of the coast, then round off the remainder
+                        step += self._velocity / self.friction
+                        self._velocity = 0.0
+                        step += self._acc
+                        self._acc = 0.0
+                        step = round(step)
+                self._acc += step
+                n = math.trunc(self._acc)
+                self._acc -= n
+            if not self._running:
+                break
+            if n:
+                pyautogui.scroll(n, _pause=False)
+                self.events += 1
+                self.units += n
+            time.sleep(max(0.0, 1.0 / self.hz - (time.monotonic() - now)))
+
+
+_instance = None
+
+
+def scroll_engine():
+    """The shared, running ScrollEngine."""
+    global _instance
+    if _instance is None:
+        _instance = ScrollEngine().start()
+    return _instance
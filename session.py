@@ -0,0 +1,115 @@
+# session.py
+
+import os
+import time
+from functools import partial
+
+from PyQt5.QtCore import QObject
+
+from camera import CameraStream
+from inference import HybridWorker, InferenceWorker, face_mesh_model, hands_model
+from landmark_log import LandmarkRecorder
+from roi import RoiTracker
+
+# hands move faster than faces, so give them a wider margin around the last box
+ROI_PADDING = {"face": 0.25, "hands": 0.4}
+
+
+def make_worker(kind, profile=None, use_roi=False):
+    """An InferenceWorker for `kind` set up as `profile` says (also used for benchmarks)."""
+    factory = partial(face_mesh_model if kind == "face" else hands_model, profile)
+    roi = None
+    if use_roi:
+        # crop only while every face/hand the model looks for is tracked
+        # (2 hands is MediaPipe's max_num_hands default)
+        max_count = 1 if kind == "face" else (profile.max_hands if profile else 2)
+        roi = RoiTracker(padding=ROI_PADDING[kind], max_count=max_count)
+        if profile is not None:
+            roi.max_side = profile.roi_side
+    return InferenceWorker(kind, model_factory=factory, roi=roi)
+
+
+class VisionSession(QObject):
+    """One long‑lived camera plus a pool of already‑initialized models.
+
+    The eye and hand tabs subscribe to the worker they need instead of opening
+    their own VideoCapture / FaceMesh / Hands, so switching modes only changes
+    which consumer is connected and does not tear anything down.
+    """
+
+    def __init__(self, src=0, kinds=("face", "hands"), use_roi=False, record_dir=None,
+                 resolution=None, profile=None, parent=None):
+        super().__init__(parent)
+        # src may also be a recorded video / image directory (see sources.py);
+        # resolution = (width, height) to request from a live camera, overriding
+        # the one of `profile` (an InferenceProfile; None → MediaPipe defaults)
+        self.profile = profile
+        if resolution is None and profile is not None:
+            resolution = profile.resolution
+        self.camera = CameraStream(src, mirror=True, size=resolution)
+        self.workers = {kind: make_worker(kind, profile, use_roi) for kind in kinds}
+        self._hybrid = None
+        # when set, every model's per-frame landmarks are logged to this directory
+        self.record_dir = record_dir
+        self._started = False
+
+    def start(self):
+        if self._started:
+            return self
+        if self.record_dir:
+            os.makedirs(self.record_dir, exist_ok=True)
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            for kind, worker in self.workers.items():
+                path = os.path.join(self.record_dir, f"{kind}_{stamp}.lmk")
+                worker.recorder = LandmarkRecorder(path, kind)
+        self.camera.start()
+        # each worker builds its model as soon as its thread starts
+        for worker in self.workers.values():
+            worker.start()
+        self._started = True
+        return self
+
+    def close(self):
+        if not self._started:
+            return
+        for worker in self.workers.values():
+            worker.stop()
+            if worker.recorder:
+                worker.recorder.close()
+                worker.recorder = None
+        self.camera.stop()
+        self._started = False
+
+    def subscribe(self, kind, slot):
+        """Connect slot to the results of the `kind` model and return its worker."""
+        self.start()
+        worker = self.workers[kind]
+        self.unsubscribe(kind, slot)
+        worker.result_ready.connect(slot)
+        return worker
+
+    def subscribe_hybrid(self, slot):
+        """Connect slot to paired face + hands results and return the HybridWorker."""
+        self.start()
+        if self._hybrid is None:
+            self._hybrid = HybridWorker(self.workers["face"], self.workers["hands"], self)
+        self.unsubscribe_hybrid(slot)
+        self._hybrid.attach()
+        self._hybrid.result_ready.connect(slot)
+        return self._hybrid
+
+    def unsubscribe_hybrid(self, slot):
+        if self._hybrid is None:
+            return
+        try:
+            self._hybrid.result_ready.disconnect(slot)
+        except TypeError:
+            pass
+        self._hybrid.detach()
+
+    def unsubscribe(self, kind, slot):
+        try:
+            self.workers[kind].result_ready.disconnect(slot)
+        except TypeError:
+            # slot was not connected
+            pass
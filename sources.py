@@ -0,0 +1,118 @@
+# sources.py
+
+import glob
+import os
+import time
+
+import cv2
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class ReplaySource:
+    """VideoCapture‑compatible source that replays a recorded session.
+
+    `path` is either a video file or a directory of images (sorted by name).
+    Image sequences take their timestamps from an optional `timestamps.txt`
+    in the same directory (one value in seconds per line), otherwise frames
+    are spaced at `fps`. With realtime=True read() sleeps so frames come out
+    with their original spacing; with realtime=False they come as fast as the
+    caller can consume them.
+    """
+
+    def __init__(self, path, realtime=True, loop=False, fps=30.0):
+        self.path = path
+        self.realtime = realtime
+        self.loop = loop
+        self.fps = fps
+        self.timestamp = 0.0  # original timestamp (s) of the last frame read
+        self.frames_read = 0
+
+        self._video = None
+        self._images = []
+        self._stamps = []
+        self._idx = 0
+        self._start = None
+        self._open()
+
+    def _open(self):
+        if os.path.isdir(self.path):
+            self._images = sorted(
+                p for p in glob.glob(os.path.join(self.path, "*"))
+                if p.lower().endswith(IMAGE_EXTS)
+            )
+            ts_file = os.path.join(self.path, "timestamps.txt")
+            if os.path.exists(ts_file):
+                with open(ts_file) as f:
+                    self._stamps = [float(line) for line in f if line.strip()]
+            if len(self._stamps) != len(self._images):
+                self._stamps = [i / self.fps for i in range(len(self._images))]
+        else:
+            self._video = cv2.VideoCapture(self.path)
+            self.fps = self._video.get(cv2.CAP_PROP_FPS) or self.fps
+
+    def isOpened(self):
+        if self._video is not None:
+            return self._video.isOpened()
+        return bool(self._images)
+
+    def set(self, prop, value):
+        # capture properties (buffer size, resolution…) don't apply to a recording
+        return False
+
+    def get(self, prop):
+        if self._video is not None:
+            return self._video.get(prop)
+        return 0.0
+
+    def _next(self):
+        if self._video is not None:
+            ret, frame = self._video.read()
+            if not ret and self.loop:
+                self._video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                self._start = None
+                ret, frame = self._video.read()
+            if not ret:
+                return False, None, 0.0
+            ts = self._video.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
+            if ts <= 0 and self.frames_read:
+                ts = self.frames_read / self.fps
+            return True, frame, ts
+
+        if self._idx >= len(self._images):
+            if not self.loop or not self._images:
+                return False, None, 0.0
+            self._idx = 0
+            self._start = None
+        frame = cv2.imread(self._images[self._idx])
+        ts = self._stamps[self._idx]
+        self._idx += 1
+        return frame is not None, frame, ts
+
+    def read(self):
+        ret, frame, ts = self._next()
+        if not ret:
+            return False, None
+        if self.realtime:
+            now = time.monotonic()
+            if self._start is None:
+                self._start = now - ts
+            delay = self._start + ts - now
+            if delay > 0:
+                time.sleep(delay)
+        self.timestamp = ts
+        self.frames_read += 1
+        return True, frame
+
+    def release(self):
+        if self._video is not None:
+            self._video.release()
+            self._video = None
+        self._images = []
+
+
+def open_source(src=0, realtime=True):
+    """Open a live camera (int or digit string) or a ReplaySource for a path."""
+    if isinstance(src, int) or (isinstance(src, str) and src.isdigit()):
+        return cv2.VideoCapture(int(src))
+    return ReplaySource(src, realtime=realtime)
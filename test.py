@@ -2,6 +2,9 @@ import cv2
 import mediapipe as mp
 import time
 
+from blink import AdaptiveBlinkDetector
+from landmarks import face_array, mean_ear
+
 # Initialize mediapipe face mesh
 mp_face_mesh = mp.solutions.face_mesh
 face_mesh = mp_face_mesh.FaceMesh(max_num_faces=1, min_detection_confidence=0.5, min_tracking_confidence=0.5)
@@ -11,17 +14,10 @@ drawing_spec = mp_draw.DrawingSpec(thickness=1, circle_radius=1)
 # Initialize webcam
 cap = cv2.VideoCapture(0)
 
-# Variables for blink detection
+# Variables for blink detection: thresholds adapt to the user's open-eye EAR
 blink_counter = 0
-last_blink_time = time.time()
-EYE_AR_THRESH = 0.2
-eye_closed = False
-
-def calculate_EAR(eye_landmarks, face_landmarks):
-    # Get the vertical distance between upper and lower eyelid
-    upper_lid = face_landmarks.landmark[eye_landmarks[0]]
-    lower_lid = face_landmarks.landmark[eye_landmarks[1]]
-    return abs(upper_lid.y - lower_lid.y)
+blink = AdaptiveBlinkDetector()
+last_confidence = 0.0
 
 while cap.isOpened():
     success, image = cap.read()
@@ -48,19 +44,11 @@ while cap.isOpened():
             left_eye = face_landmarks.landmark[33]
             right_eye = face_landmarks.landmark[263]
             
-            # Calculate EAR (Eye Aspect Ratio) for both eyes
-            left_ear = calculate_EAR([159, 145], face_landmarks)  # Upper and lower eyelid indices
-            right_ear = calculate_EAR([386, 374], face_landmarks)
-            ear = (left_ear + right_ear) / 2
-            
-            # Detect blink
-            if ear < EYE_AR_THRESH and not eye_closed:
-                eye_closed = True
-                if time.time() - last_blink_time > 0.2:  # Minimum time between blinks
-                    blink_counter += 1
-                    last_blink_time = time.time()
-            elif ear >= EYE_AR_THRESH:
-                eye_closed = False
+            # Detect blink from the mean EAR of both eyes
+            event = blink.update(mean_ear(face_array(results)), time.monotonic())
+            if event:
+                blink_counter += 1
+                last_confidence = event.confidence
             
             # Calculate direction
             direction_h = "Center"
@@ -79,8 +67,10 @@ while cap.isOpened():
             # Display direction and blink count
             cv2.putText(image, f"Looking: {direction_h} {direction_v}", (10, 30), 
                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-            cv2.putText(image, f"Blinks: {blink_counter}", (10, 70), 
+            cv2.putText(image, f"Blinks: {blink_counter} (conf {last_confidence:.2f})", (10, 70), 
                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+            cv2.putText(image, f"EAR close/open: {blink.close_thresh:.3f}/{blink.open_thresh:.3f}", (10, 110),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
     
     cv2.imshow('Face Mesh', image)
     
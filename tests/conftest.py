@@ -0,0 +1,6 @@
+# tests/conftest.py
+# the modules under test live flat in the repository root
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,66 @@
+# tests/test_blink.py
+
+from blink import AdaptiveBlinkDetector
+
+FPS = 30.0
+
+
+def _feed(det, ears, t0=0.0):
+    """Feed one EAR per frame; returns (events, time after the last frame)."""
+    events = []
+    t = t0
+    for ear in ears:
+        ev = det.update(ear, t)
+        if ev:
+            events.append(ev)
+        t += 1.0 / FPS
+    return events, t
+
+
+def _warm(det):
+    events, t = _feed(det, [0.3] * 40)
+    assert not events and det.ready
+    return t
+
+
+def test_blink_fires_once_on_reopen():
+    det = AdaptiveBlinkDetector()
+    t = _warm(det)
+    events, _ = _feed(det, [0.1] * 5 + [0.3] * 5, t)
+    assert len(events) == 1
+    ev = events[0]
+    assert 0.1 < ev.duration < 0.2
+    assert ev.min_ear == 0.1
+    assert 0.5 <= ev.confidence <= 1.0
+
+
+def test_hysteresis_between_thresholds():
+    det = AdaptiveBlinkDetector()
+    t = _warm(det)
+    between = (det.open_thresh + det.close_thresh) / 2
+    # closes, then wobbles between the two thresholds: still one closure
+    events, t = _feed(det, [0.1, 0.1, between, 0.1, between, between], t)
+    assert not events and det.closed
+    events, _ = _feed(det, [0.3], t)
+    assert len(events) == 1
+
+
+def test_too_short_and_too_long_closures_are_not_blinks():
+    det = AdaptiveBlinkDetector()
+    t = _warm(det)
+    # one frame closed (33 ms) is landmark jitter
+    events, t = _feed(det, [0.1, 0.3, 0.3], t)
+    assert not events
+    # a second with the eyes shut is looking down, not a blink
+    events, _ = _feed(det, [0.1] * 30 + [0.3], t)
+    assert not events
+
+
+def test_restore_is_ready_immediately():
+    det = AdaptiveBlinkDetector()
+    _warm(det)
+    fresh = AdaptiveBlinkDetector()
+    fresh.restore(det.to_dict())
+    assert fresh.ready
+    events, _ = _feed(fresh, [0.1] * 5 + [0.3])
+    assert len(events) == 1
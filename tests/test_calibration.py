@@ -0,0 +1,67 @@
+# tests/test_calibration.py
+
+import numpy as np
+import pytest
+
+from calibration import DRIFT_TOLERANCE, CalibrationModel, grid_targets
+
+
+def _features(targets):
+    # a smooth, slightly non-linear iris → screen relation over a small range
+    return [(0.45 + 0.1 * u + 0.01 * u * v, 0.48 + 0.06 * v + 0.01 * u * u) for u, v in targets]
+
+
+def test_grid_targets():
+    assert len(grid_targets(9)) == 9
+    assert len(grid_targets(16)) == 16
+    assert grid_targets(9)[4] == pytest.approx((0.5, 0.5))
+    with pytest.raises(ValueError):
+        grid_targets(10)
+
+
+def test_poly2_fit_maps_targets_back():
+    targets = grid_targets(9)
+    model = CalibrationModel().fit(_features(targets), targets)
+    assert model.kind == "poly2"
+    # the ridge term keeps it from being exact
+    assert model.rms_error < 5e-3
+    for f, t in zip(_features(targets), targets):
+        assert model.map(*f) == pytest.approx(t, abs=5e-3)
+
+
+def test_few_points_fall_back_to_affine():
+    targets = [(0.1, 0.1), (0.9, 0.1), (0.5, 0.9), (0.5, 0.5)]
+    model = CalibrationModel().fit(_features(targets), targets)
+    assert model.kind == "affine"
+    with pytest.raises(ValueError):
+        CalibrationModel().fit(_features(targets[:2]), targets[:2])
+
+
+def test_map_clips_to_screen():
+    targets = grid_targets(9)
+    model = CalibrationModel().fit(_features(targets), targets)
+    u, v = model.map(10.0, -10.0)
+    assert 0.0 <= u <= 1.0 and 0.0 <= v <= 1.0
+
+
+def test_recenter_absorbs_small_drift_only():
+    targets = grid_targets(9)
+    model = CalibrationModel().fit(_features(targets), targets)
+    fx, fy = _features([(0.5, 0.5)])[0]
+
+    ok, err = model.recenter((fx + 0.002, fy))
+    assert ok and 0.0 < err < DRIFT_TOLERANCE
+    assert model.map(fx + 0.002, fy) == pytest.approx((0.5, 0.5), abs=1e-6)
+
+    ok, err = model.recenter((fx + 0.05, fy))
+    assert not ok and err > DRIFT_TOLERANCE
+
+
+def test_dict_round_trip():
+    targets = grid_targets(16)
+    model = CalibrationModel().fit(_features(targets), targets)
+    model.recenter(_features([(0.5, 0.5)])[0])
+    copy = CalibrationModel.from_dict(model.to_dict())
+    for f in _features(targets):
+        assert copy.map(*f) == pytest.approx(model.map(*f))
+    assert np.allclose(copy.bias, model.bias)
@@ -0,0 +1,54 @@
+# tests/test_dwell.py
+
+from dwell import DwellEngine
+
+
+def _hold(eng, x, y, t0, seconds, fps=30.0):
+    fired = []
+    n = int(seconds * fps)
+    for i in range(n):
+        action = eng.update(x, y, t0 + i / fps)
+        if action:
+            fired.append(action)
+    return fired, t0 + n / fps
+
+
+def test_fires_once_per_dwell():
+    eng = DwellEngine(dwell=1.0, radius=30)
+    fired, _ = _hold(eng, 100, 100, 0.0, 3.0)
+    assert fired == ["click"]
+
+
+def test_jitter_inside_radius_keeps_the_dwell():
+    eng = DwellEngine(dwell=1.0, radius=30)
+    fired = [eng.update(100 + (10 if i % 2 else -10), 100, i / 30.0) for i in range(45)]
+    assert [a for a in fired if a] == ["click"]
+
+
+def test_leaving_rearms():
+    eng = DwellEngine(dwell=0.5, radius=30, action="right")
+    fired, t = _hold(eng, 100, 100, 0.0, 1.0)
+    assert fired == ["right"]
+    # beyond the exit radius, then a second dwell there
+    fired, _ = _hold(eng, 300, 100, t, 1.0)
+    assert fired == ["right"]
+
+
+def test_tick_fires_between_frames():
+    eng = DwellEngine(dwell=1.0, radius=30)
+    for t in (0.0, 0.2, 0.4, 0.6, 0.8):
+        assert eng.update(100, 100, t) is None
+    assert eng.tick(0.9) is None and 0.85 < eng.progress < 0.95
+    # a timer tick past the dwell fires, as long as the last sample is recent
+    assert eng.tick(1.05) == "click"
+    assert eng.tick(1.1) is None
+
+
+def test_tracking_gap_cancels():
+    eng = DwellEngine(dwell=1.0, radius=30, max_gap=0.3)
+    eng.update(100, 100, 0.0)
+    eng.update(100, 100, 0.2)
+    assert eng.tick(0.9) is None and eng.progress == 0.0
+    # the next sample starts a new dwell from scratch
+    assert eng.update(100, 100, 1.0) is None
+    assert eng.progress == 0.0
@@ -0,0 +1,38 @@
+# tests/test_filters.py
+
+import pytest
+
+from filters import KalmanFilter, OneEuroFilter, Predictor, filter_from_dict, filter_to_dict
+
+
+@pytest.mark.parametrize("cls", [OneEuroFilter, KalmanFilter])
+def test_still_input_stays_put(cls):
+    f = cls()
+    for i in range(30):
+        x, y = f.filter(500.0, 300.0, i / 30.0)
+    assert (x, y) == pytest.approx((500.0, 300.0), abs=1e-6)
+
+
+def test_one_euro_smooths_jitter_and_restarts_after_a_gap():
+    f = OneEuroFilter(min_cutoff=0.5, beta=0.0)
+    outs = [f.filter(500.0 + (5 if i % 2 else -5), 300.0, i / 30.0)[0] for i in range(60)]
+    assert max(outs[30:]) - min(outs[30:]) < 5
+    # tracking lost for longer than max_gap: no smoothing toward the old point
+    assert f.filter(900.0, 300.0, 60 / 30.0 + 1.0) == (900.0, 300.0)
+
+
+def test_filter_dict_round_trip():
+    f = OneEuroFilter(min_cutoff=0.8, beta=0.02)
+    g = filter_from_dict(filter_to_dict(f))
+    assert type(g) is OneEuroFilter and (g.min_cutoff, g.beta) == (0.8, 0.02)
+
+
+def test_predictor_leads_steady_motion_only():
+    p = Predictor()
+    for i in range(10):
+        x, _ = p.predict(100.0 + 10 * i, 300.0, i / 30.0, horizon=0.05)
+    assert x > 190.0  # ahead of the last sample, in the direction of travel
+    still = Predictor()
+    for i in range(10):
+        x, _ = still.predict(100.0, 300.0, i / 30.0, horizon=0.05)
+    assert x == pytest.approx(100.0)
@@ -0,0 +1,84 @@
+# tests/test_gestures.py
+
+import numpy as np
+
+from gestures import FEATURE_INDEX, GestureEngine, hand_features
+from landmarks import FINGER_CHAINS
+
+# knuckle (MCP) of each finger in palm units, wrist at the origin, y up = negative
+_MCP = {"thumb": (-0.4, -0.2), "index": (-0.3, -0.95), "middle": (0.0, -1.0),
+        "ring": (0.25, -0.95), "pinky": (0.45, -0.85)}
+_BONE = 0.35
+
+
+def make_hand(bent=(), thumb_tip=None):
+    """A (21, 3) hand in normalized image coordinates.
+
+    Straight fingers continue the wrist → knuckle line; a bent one folds 90°
+    at each of its three joints (toward the camera, down, back to the palm).
+    """
+    p = np.zeros((21, 3))
+    for name, chain in zip(_MCP, FINGER_CHAINS):
+        mcp = np.array([*_MCP[name], 0.0])
+        d = mcp / np.linalg.norm(mcp)
+        if name in bent:
+            steps = [(0, 0, -_BONE), (0, _BONE, 0), (0, 0, _BONE)]
+        else:
+            steps = [d * _BONE] * 3
+        pts = [mcp]
+        for s in steps:
+            pts.append(pts[-1] + s)
+        p[chain[1:]] = pts
+    if thumb_tip is not None:
+        p[4] = (*thumb_tip, 0.0)
+    # palm units → a hand 0.1 of the frame tall near the bottom centre
+    return (np.array([0.5, 0.8, 0.0]) + 0.1 * p).astype(np.float32)
+
+
+def _settle(eng, hand, frames=3):
+    for _ in range(frames):
+        state = eng.update(hand)
+    return state
+
+
+def test_features_are_scale_invariant():
+    hand = make_hand()
+    small = (hand - hand[0]) * 0.5 + hand[0]
+    assert np.allclose(hand_features(hand), hand_features(small), atol=1e-5)
+    assert hand_features(hand)[FEATURE_INDEX["index_curl"]] < 0.05
+
+
+def test_classifies_basic_gestures():
+    eng = GestureEngine()
+    assert _settle(eng, make_hand()).active == {"open_palm"}
+
+    eng = GestureEngine()
+    index_tip = make_hand()[8]
+    pinch = make_hand(thumb_tip=((index_tip[0] - 0.5) / 0.1 + 0.05, (index_tip[1] - 0.8) / 0.1))
+    assert _settle(eng, pinch).active == {"pinch"}
+
+    eng = GestureEngine()
+    fist = make_hand(bent=("index", "middle", "ring", "pinky"), thumb_tip=(-0.2, -0.6))
+    assert "fist" in _settle(eng, fist).active
+    assert "open_palm" not in eng.state.active
+
+
+def test_debounce_and_edges():
+    eng = GestureEngine(debounce=2)
+    palm = make_hand()
+    first = eng.update(palm)
+    assert not first.active and not first.started
+    second = eng.update(palm)
+    assert second.started == {"open_palm"} and second.active == {"open_palm"}
+    assert not eng.update(palm).started
+    # the hand leaving ends everything at once
+    gone = eng.update(None)
+    assert gone.ended == {"open_palm"} and not gone.active
+
+
+def test_single_glitch_frame_does_not_toggle():
+    eng = GestureEngine(debounce=2)
+    palm, fist = make_hand(), make_hand(bent=("index", "middle", "ring", "pinky"), thumb_tip=(-0.2, -0.6))
+    _settle(eng, palm)
+    assert not eng.update(fist).ended
+    assert eng.update(palm).active == {"open_palm"}
@@ -0,0 +1,57 @@
+# tests/test_input_state.py
+
+import pytest
+
+pytest.importorskip("pyautogui")  # input_state → cursor
+
+from input_state import InputState
+
+
+class FakeActuator:
+    def __init__(self):
+        self.calls = []
+
+    def mouse_down(self, name):
+        self.calls.append(("down", name))
+
+    def mouse_up(self, name):
+        self.calls.append(("up", name))
+
+    def key_down(self, name):
+        self.calls.append(("key_down", name))
+
+    def key_up(self, name):
+        self.calls.append(("key_up", name))
+
+
+def test_held_button_is_one_event():
+    act = FakeActuator()
+    inp = InputState(act)
+    for _ in range(100):
+        inp.button("left", True)
+        inp.flush()
+    inp.button("left", False)
+    inp.flush()
+    assert act.calls == [("down", "left"), ("up", "left")]
+    assert inp.stats() == {"requests": 101, "emitted": 2, "suppressed": 99}
+
+
+def test_press_and_release_in_one_frame_cancel():
+    act = FakeActuator()
+    inp = InputState(act)
+    inp.button("left", True)
+    inp.button("left", False)
+    assert inp.flush() == 0
+    assert act.calls == [] and not inp.is_down("left")
+
+
+def test_release_all_lets_go_of_everything_held():
+    act = FakeActuator()
+    inp = InputState(act)
+    inp.button("left")
+    inp.key("shift")
+    inp.flush()
+    assert inp.is_down("shift", kind="key")
+    assert inp.release_all() == 2
+    assert ("up", "left") in act.calls and ("key_up", "shift") in act.calls
+    assert inp.release_all() == 0
@@ -0,0 +1,64 @@
+# tests/test_landmark_log.py
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import landmark_log
+from landmark_log import LandmarkRecorder
+
+
+def test_face_round_trip(tmp_path):
+    path = tmp_path / "face.lmk"
+    rng = np.random.default_rng(0)
+    faces = [rng.random((478, 3), dtype=np.float32), None, rng.random((478, 3), dtype=np.float32)]
+    rec = LandmarkRecorder(path, "face")
+    for i, lm in enumerate(faces):
+        rec.write(SimpleNamespace(ts=i * 0.5, landmarks=lm))
+    rec.close()
+
+    assert landmark_log.read_header(path) == ("face", 478, 2)
+    log = landmark_log.load(path)
+    assert len(log) == 3
+    assert log["ts"].tolist() == [0.0, 0.5, 1.0]
+    assert log["present"].tolist() == [1, 0, 1]
+    assert np.array_equal(log["lm"][0], faces[0])
+    assert not log["lm"][1].any()
+
+
+def test_hands_round_trip(tmp_path):
+    path = tmp_path / "hands.lmk"
+    a, b = np.full((21, 3), 0.25, np.float32), np.full((21, 3), 0.75, np.float32)
+    rec = LandmarkRecorder(path, "hands")
+    rec.write(SimpleNamespace(ts=1.0, hands=[a, b], labels=["Left", "Right"]))
+    rec.write(SimpleNamespace(ts=2.0, hands=[b], labels=["Right"]))
+    rec.write(SimpleNamespace(ts=3.0, hands=[], labels=[]))
+    rec.close()
+
+    log = landmark_log.load(path)
+    assert log["count"].tolist() == [2, 1, 0]
+    assert log["handedness"].tolist() == [[0, 1], [1, -1], [-1, -1]]
+    assert np.array_equal(log["lm"][0, 1], b)
+    assert np.array_equal(log["lm"][1, 0], b)
+
+
+def test_partial_record_is_ignored(tmp_path):
+    path = tmp_path / "face.lmk"
+    rec = LandmarkRecorder(path, "face")
+    rec.write(SimpleNamespace(ts=0.0, landmarks=None))
+    rec.close()
+    with open(path, "ab") as f:
+        f.write(b"\x00" * 10)  # killed mid-write
+    assert len(landmark_log.load(path)) == 1
+
+
+def test_empty_and_foreign_files(tmp_path):
+    path = tmp_path / "empty.lmk"
+    LandmarkRecorder(path, "hands").close()
+    assert len(landmark_log.load(path)) == 0
+
+    bad = tmp_path / "bad.lmk"
+    bad.write_bytes(b"\x00" * 64)
+    with pytest.raises(ValueError):
+        landmark_log.load(bad)
@@ -0,0 +1,70 @@
+# tests/test_roi.py
+
+import numpy as np
+import pytest
+
+from roi import RoiTracker
+
+FRAME = np.zeros((480, 640, 3), np.uint8)
+
+
+def test_full_frame_until_something_is_tracked():
+    roi = RoiTracker()
+    img, box = roi.crop(FRAME)
+    assert img is FRAME and box == (0, 0, 640, 480)
+
+
+def test_remaps_crop_landmarks_to_the_full_frame():
+    roi = RoiTracker()
+    box = (100, 50, 300, 250)
+    lm = np.array([[0.5, 0.5, -0.1], [0.0, 1.0, 0.2]], np.float32)
+    roi.update([lm], box, FRAME.shape)
+    assert lm[0, 0] == pytest.approx(200 / 640)
+    assert lm[0, 1] == pytest.approx(150 / 480)
+    assert lm[1, :2] == pytest.approx((100 / 640, 250 / 480))
+    # z is in units of the input width, so it shrinks with the crop like x
+    assert lm[:, 2] == pytest.approx([-0.1 * 200 / 640, 0.2 * 200 / 640])
+
+
+def test_full_frame_is_left_untouched():
+    roi = RoiTracker()
+    lm = np.array([[0.5, 0.5, -0.1]], np.float32)
+    roi.update([lm.copy()], (0, 0, 640, 480), FRAME.shape)
+    out = lm.copy()
+    roi.update([out], (0, 0, 640, 480), FRAME.shape)
+    assert np.allclose(out, lm)
+
+
+def test_crops_around_the_landmarks():
+    roi = RoiTracker(padding=0.25, max_side=64)
+    lm = np.array([[0.4, 0.4, 0.0], [0.5, 0.5, 0.0]], np.float32)
+    roi.update([lm], (0, 0, 640, 480), FRAME.shape)
+    x0, y0, x1, y1 = roi.box
+    assert x0 < 0.4 * 640 and x1 > 0.5 * 640 and y0 < 0.4 * 480 and y1 > 0.5 * 480
+    img, box = roi.crop(FRAME)
+    assert box == roi.box
+    assert max(img.shape[:2]) <= 64  # downscaled to max_side
+
+
+def test_waits_for_every_hand_before_cropping():
+    roi = RoiTracker(max_count=2)
+    hand = np.array([[0.4, 0.4, 0.0], [0.5, 0.5, 0.0]], np.float32)
+    roi.update([hand.copy()], (0, 0, 640, 480), FRAME.shape)
+    assert roi.crop(FRAME)[0] is FRAME
+    roi.update([hand.copy(), hand.copy() + 0.01], (0, 0, 640, 480), FRAME.shape)
+    assert roi.crop(FRAME)[0] is not FRAME
+
+
+def test_first_crop_miss_is_held_then_dropped():
+    roi = RoiTracker()
+    lm = np.array([[0.4, 0.4, 0.0], [0.5, 0.5, 0.0]], np.float32)
+    roi.update([lm], (0, 0, 640, 480), FRAME.shape)
+    _, box = roi.crop(FRAME)
+    assert roi.reframed
+    # the switch to the crop lost the face: hold it and try the crop once more
+    roi.update([], box, FRAME.shape)
+    assert roi.held and roi.box == box
+    _, box = roi.crop(FRAME)
+    roi.update([], box, FRAME.shape)
+    assert not roi.held and roi.box is None
+    assert roi.crop(FRAME)[0] is FRAME
@@ -0,0 +1,54 @@
+# tests/test_scheduler.py
+
+from scheduler import FrameScheduler
+
+
+class FakeTimer:
+    def __init__(self):
+        self.starts = []
+        self.active = False
+
+    def setSingleShot(self, on):
+        pass
+
+    def start(self, ms):
+        self.starts.append(ms)
+        self.active = True
+
+    def stop(self):
+        self.active = False
+
+
+def test_backs_off_when_over_budget_and_recovers():
+    timer = FakeTimer()
+    s = FrameScheduler(timer, active_ms=30, max_ms=250)
+    s.start()
+    s.submitted()
+    s.frame_done(True, busy_ms=60.0)
+    assert s.interval_ms == 90.0
+    for _ in range(50):
+        s.submitted()
+        s.frame_done(True, busy_ms=10.0)
+    assert s.interval_ms == 30
+
+
+def test_idles_without_detections():
+    timer = FakeTimer()
+    s = FrameScheduler(timer, active_ms=30, idle_ms=200, idle_after=0.0)
+    s.start()
+    s.submitted()
+    s.frame_done(False, busy_ms=5.0)
+    assert s.idle and s.interval_ms == 200
+    s._last_detect += 10.0  # pretend a detection is due back
+    s.frame_done(True, busy_ms=5.0)
+    assert not s.idle and s.interval_ms == 30
+
+
+def test_results_after_stop_are_ignored():
+    timer = FakeTimer()
+    s = FrameScheduler(timer)
+    s.start()
+    s.stop()
+    n = len(timer.starts)
+    s.frame_done(True, busy_ms=5.0)
+    assert len(timer.starts) == n and not timer.active
@@ -0,0 +1,60 @@
+# tests/test_scroll.py
+
+import time
+
+import pytest
+
+pyautogui = pytest.importorskip("pyautogui")
+
+from scroll import ScrollEngine
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    sent = []
+    monkeypatch.setattr(pyautogui, "scroll", lambda n, _pause=True: sent.append(n))
+    eng = ScrollEngine(hz=500.0).start()
+    eng.sent = sent
+    yield eng
+    eng.stop()
+
+
+def _wait_idle(eng, timeout=3.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        with eng._cond:
+            if not eng._velocity and not eng._pending:
+                break
+        time.sleep(0.01)
+    time.sleep(0.02)  # let the last tick's scroll() land
+
+
+@pytest.mark.parametrize("distance", [37, -12, 5])
+def test_fling_travels_exactly_distance(engine, distance):
+    engine.fling(distance)
+    _wait_idle(engine)
+    assert sum(engine.sent) == distance
+
+
+def test_fling_coasts(engine):
+    engine.fling(40)
+    _wait_idle(engine)
+    # spread over many ticks, not one jump
+    assert len(engine.sent) > 3
+
+
+def test_slow_drags_add_up(engine):
+    t = time.monotonic()
+    for i in range(10):
+        engine.drag(0.5, t + i * 0.1)
+        time.sleep(0.005)
+    _wait_idle(engine)
+    assert sum(engine.sent) == 5
+
+
+def test_halt_stops_a_coast(engine):
+    engine.fling(10000)
+    time.sleep(0.05)
+    engine.halt()
+    _wait_idle(engine)
+    assert 0 < sum(engine.sent) < 10000
@@ -7,6 +7,8 @@ import subprocess
 from dotenv import load_dotenv
 import re
 
+from scroll import scroll_engine
+
 # Load ElevenLabs API key from .env (not used since TTS is removed)
 # load_dotenv()
 
@@ -132,9 +134,8 @@ def handle_chrome_command(text):
     scroll_parsed = parse_scroll_command(text)
     if scroll_parsed and is_chrome_focused():
         scroll_amt, times = scroll_parsed
-        for _ in range(times):
-            pyautogui.scroll(scroll_amt)
-            time.sleep(0.1)
+        # one smooth coast instead of `times` jumps 0.1 s apart
+        scroll_engine().fling(scroll_amt * times)
         return True
     return False
 